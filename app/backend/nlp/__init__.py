@@ -1,20 +1,34 @@
 import spacy
+import torch
 from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification, AutoModelForQuestionAnswering
 from sentence_transformers import SentenceTransformer, util as st_util
 from rapidfuzz import fuzz
 import os
 import logging
+import functools
 from flask import current_app, g
 from typing import Dict, List, Tuple, Any, Optional
 
 _nlp_analyzer = None
 
+def _pipeline_device_kwargs() -> Dict[str, Any]:
+    """Run transformer pipelines on the first GPU in half precision when one is available."""
+    if torch.cuda.is_available():
+        return {'device': 0, 'torch_dtype': torch.float16}
+    return {'device': -1}
+
 class NLPAnalyzer:
     """NLP analyzer for interview responses."""
 
     def __init__(self, testing=False):
         """Initialize NLP components."""
         self.testing = testing
+        self._sentiment_analyzer = None
+        self._sentiment_failed = False
+        self._zero_shot_classifier = None
+        # Repeated texts (boilerplate answers, retries) skip the transformer forward pass
+        self._sentiment = functools.lru_cache(maxsize=1024)(self._run_sentiment)
+        self._zero_shot = functools.lru_cache(maxsize=1024)(self._run_zero_shot)
         if not testing:
             try:
                 print("NLPAnalyzer: loading SpaCy model")
@@ -40,29 +54,14 @@ class NLPAnalyzer:
                 # print("NLPAnalyzer: SentenceTransformer loaded")
                 # cache_dir = current_app.config.get('TRANSFORMERS_CACHE')
                 # os.environ['TRANSFORMERS_CACHE'] = cache_dir or os.path.join(os.getcwd(), 'models')
-                # Initialize a simple sentiment analyzer
-                try:
-                    print("NLPAnalyzer: loading sentiment pipeline")
-                    self.sentiment_analyzer = pipeline("sentiment-analysis")
-                    print("NLPAnalyzer: sentiment pipeline loaded")
-                except Exception as e:
-                    print(f"NLPAnalyzer: failed to load sentiment pipeline: {e}")
-                    # We'll handle this gracefully in the analyze_response method
-                # print("NLPAnalyzer: sentiment pipeline loaded")
+                # The sentiment and zero-shot pipelines are loaded on first use,
+                # see the sentiment_analyzer and zero_shot_classifier properties
                 # print("NLPAnalyzer: loading QA pipeline")
                 # qa_model_name = "distilbert-base-cased-distilled-squad"
                 # qa_tokenizer = AutoTokenizer.from_pretrained(qa_model_name)
                 # qa_model = AutoModelForQuestionAnswering.from_pretrained(qa_model_name)
                 # self.question_answering = pipeline("question-answering", model=qa_model, tokenizer=qa_tokenizer)
                 # print("NLPAnalyzer: QA pipeline loaded")
-                print("NLPAnalyzer: loading zero-shot pipeline")
-                model_name = "facebook/bart-large-mnli"
-                self.zero_shot_classifier = pipeline(
-                    "zero-shot-classification",
-                    model=model_name,
-                    tokenizer=model_name
-                )
-                print("NLPAnalyzer: zero-shot pipeline loaded")
                 # print("NLPAnalyzer: zero-shot pipeline loaded")
                 # print("NLPAnalyzer: loading summarizer pipeline (distilbart-cnn-12-6)")
                 # summary_model = "sshleifer/distilbart-cnn-12-6"
@@ -88,8 +87,63 @@ class NLPAnalyzer:
                 logging.error(f"Error initializing NLP components: {e}")
                 raise
 
-    def analyze_response(self, response_text: str, question_context: Optional[str] = None) -> Dict[str, Any]:
-        """Analyze a response text."""
+    @property
+    def sentiment_analyzer(self):
+        """Sentiment pipeline, loaded on first use; None if it can't be loaded."""
+        if self._sentiment_analyzer is None and not self._sentiment_failed:
+            try:
+                print("NLPAnalyzer: loading sentiment pipeline")
+                self._sentiment_analyzer = pipeline("sentiment-analysis", **_pipeline_device_kwargs())
+                print("NLPAnalyzer: sentiment pipeline loaded")
+            except Exception as e:
+                print(f"NLPAnalyzer: failed to load sentiment pipeline: {e}")
+                # We'll handle this gracefully in the analyze_response method
+                self._sentiment_failed = True
+        return self._sentiment_analyzer
+
+    @property
+    def zero_shot_classifier(self):
+        """Zero-shot classification pipeline, loaded on first use."""
+        if self._zero_shot_classifier is None:
+            print("NLPAnalyzer: loading zero-shot pipeline")
+            model_name = "facebook/bart-large-mnli"
+            self._zero_shot_classifier = pipeline(
+                "zero-shot-classification",
+                model=model_name,
+                tokenizer=model_name,
+                **_pipeline_device_kwargs()
+            )
+            print("NLPAnalyzer: zero-shot pipeline loaded")
+        return self._zero_shot_classifier
+
+    def _run_sentiment(self, text: str) -> Dict[str, Any]:
+        """Run the sentiment pipeline on one text."""
+        # Load the pipeline outside inference_mode so its weights are ordinary tensors
+        analyzer = self.sentiment_analyzer
+        with torch.inference_mode():
+            return analyzer(text)[0]
+
+    def _run_zero_shot(self, text: str, candidate_labels: Tuple[str, ...]) -> Dict[str, Any]:
+        """Run the zero-shot pipeline on one text against the candidate labels."""
+        classifier = self.zero_shot_classifier
+        with torch.inference_mode():
+            return classifier(text, list(candidate_labels))
+
+    def analyze_responses(self, pairs: List[Tuple[str, Optional[str]]]) -> List[Dict[str, Any]]:
+        """Analyze several (response text, question context) pairs, parsing them with spaCy in one batch."""
+        if self.testing:
+            return [self.analyze_response(text, question) for text, question in pairs]
+
+        # Empty responses never reach spaCy, so only the others go through nlp.pipe
+        texts = [text for text, _ in pairs if text.strip()]
+        docs = iter(self.nlp.pipe(texts))
+        return [
+            self.analyze_response(text, question, doc=next(docs) if text.strip() else None)
+            for text, question in pairs
+        ]
+
+    def analyze_response(self, response_text: str, question_context: Optional[str] = None, doc=None) -> Dict[str, Any]:
+        """Analyze a response text, reusing its spaCy doc when the caller already parsed it."""
         if self.testing:
             return {
                 'feedback': 'Your response was clear and professional.',
@@ -116,7 +170,8 @@ class NLPAnalyzer:
 
         try:
             # Process text with spaCy
-            doc = self.nlp(response_text)
+            if doc is None:
+                doc = self.nlp(response_text)
             # Identify STAR components
             star_components = self.identify_star_components(doc)
             # Extract key points
@@ -126,7 +181,7 @@ class NLPAnalyzer:
             # Analyze professional tone
             professional_tone = self.analyze_professional_tone(response_text)
             # Analyze clarity
-            clarity = self.analyze_clarity(response_text)
+            clarity = self.analyze_clarity(response_text, doc)
             # Analyze sentiment (handle long responses)
             max_length = 512
             if len(response_text) > max_length:
@@ -135,8 +190,8 @@ class NLPAnalyzer:
                 response_text = ' '.join(tokens[:max_length])
 
             # Check if sentiment_analyzer is available
-            if hasattr(self, 'sentiment_analyzer'):
-                sentiment = self.sentiment_analyzer(response_text)[0]
+            if self.sentiment_analyzer is not None:
+                sentiment = self._sentiment(response_text)
                 sentiment_score = 1.0 if sentiment['label'] == 'POSITIVE' else 0.0
             else:
                 # Fallback if sentiment_analyzer is not available
@@ -151,10 +206,10 @@ class NLPAnalyzer:
                                             completeness_score)
 
             # Soft skills & technical depth (zero-shot classification)
-            soft_skill_labels = ["communication", "leadership", "problem solving", "teamwork", "adaptability", "initiative", "empathy"]
-            technical_labels = ["technical depth", "domain expertise", "innovation"]
-            soft_skills = self.zero_shot_classifier(response_text, soft_skill_labels)
-            technical_skills = self.zero_shot_classifier(response_text, technical_labels)
+            soft_skill_labels = ("communication", "leadership", "problem solving", "teamwork", "adaptability", "initiative", "empathy")
+            technical_labels = ("technical depth", "domain expertise", "innovation")
+            soft_skills = self._zero_shot(response_text, soft_skill_labels)
+            technical_skills = self._zero_shot(response_text, technical_labels)
             soft_skills_scores = dict(zip(soft_skills['labels'], soft_skills['scores']))
             technical_scores = dict(zip(technical_skills['labels'], technical_skills['scores']))
 
@@ -238,9 +293,10 @@ class NLPAnalyzer:
         }
 
         # Weight sentences by position in the response
-        total_sents = len(list(doc.sents))
+        sentences = list(doc.sents)
+        total_sents = len(sentences)
 
-        for i, sent in enumerate(doc.sents):
+        for i, sent in enumerate(sentences):
             sent_text = sent.text.lower()
             position_ratio = i / total_sents if total_sents > 0 else 0
 
@@ -369,15 +425,15 @@ class NLPAnalyzer:
             raise ValueError("Text cannot be empty")
 
         try:
-            candidate_labels = [
+            candidate_labels = (
                 "professional",
                 "casual",
                 "technical",
                 "confident",
                 "uncertain"
-            ]
+            )
 
-            result = self.zero_shot_classifier(text, candidate_labels)
+            result = self._zero_shot(text, candidate_labels)
             return {
                 'score': result['scores'][result['labels'].index('professional')],
                 'confidence': result['scores'][result['labels'].index('confident')]
@@ -386,20 +442,22 @@ class NLPAnalyzer:
             logging.error(f"Error analyzing professional tone: {e}")
             raise
 
-    def analyze_clarity(self, text: str) -> Dict[str, float]:
+    def analyze_clarity(self, text: str, doc=None) -> Dict[str, float]:
         """Analyze the clarity and coherence of the response."""
         if not text:
             raise ValueError("Text cannot be empty")
 
         try:
-            doc = self.nlp(text)
+            if doc is None:
+                doc = self.nlp(text)
 
-            # Calculate average sentence length
+            # Calculate average sentence length; sentences partition the doc,
+            # so their token counts add up to len(doc)
             sentences = list(doc.sents)
-            avg_sentence_length = sum(len(sent) for sent in sentences) / len(sentences)
+            avg_sentence_length = len(doc) / len(sentences)
 
             # Calculate readability
-            readability_score = self._calculate_readability(doc)
+            readability_score = self._calculate_readability(doc, sentences)
 
             # Calculate entity density
             num_entities = len(doc.ents)
@@ -418,14 +476,15 @@ class NLPAnalyzer:
             logging.error(f"Error analyzing clarity: {e}")
             raise
 
-    def _calculate_readability(self, doc) -> float:
+    def _calculate_readability(self, doc, sentences: Optional[list] = None) -> float:
         """Calculate readability score using spaCy doc."""
         try:
-            sentences = list(doc.sents)
+            if sentences is None:
+                sentences = list(doc.sents)
             if not sentences:
                 return 0.0
 
-            total_words = sum(len(sent) for sent in sentences)
+            total_words = len(doc)
             total_sentences = len(sentences)
 
             # Calculate average words per sentence
@@ -592,6 +651,11 @@ def analyze_response(response_text: str, question_context: Optional[str] = None)
     nlp = get_nlp()
     return nlp.analyze_response(response_text, question_context)
 
+def analyze_responses(pairs: List[Tuple[str, Optional[str]]]) -> List[Dict[str, Any]]:
+    """Analyze several (response text, question context) pairs using the NLP analyzer."""
+    nlp = get_nlp()
+    return nlp.analyze_responses(pairs)
+
 def init_nlp(app):
     """Initialize NLP components."""
     print("init_nlp: start")
@@ -2949,9 +2949,12 @@ class AdvancedNLPAnalysis:
             from sentence_transformers import SentenceTransformer, util as st_util
             self.st_model = SentenceTransformer('all-MiniLM-L6-v2')
             self.st_util = st_util
+            # The generic answers are fixed, so embed them once rather than per response
+            self.generic_embs = self.st_model.encode(self.generic_answers, convert_to_tensor=True)
         except Exception as e:
             self.st_model = None
             self.st_util = None
+            self.generic_embs = None
             logging.warning(f"SentenceTransformer not available: {e}")
 
     def analyze_originality(self, response_text: str) -> dict:
@@ -2960,11 +2963,10 @@ class AdvancedNLPAnalysis:
         try:
             if not self.st_model or not self.st_util:
                 return {'originality_score': 1.0, 'is_generic': False, 'most_similar': None}
-            # Compute embeddings
+            # Compute the response embedding; generic answer embeddings are precomputed
             response_emb = self.st_model.encode([response_text], convert_to_tensor=True)
-            generic_embs = self.st_model.encode(self.generic_answers, convert_to_tensor=True)
             # Compute similarities
-            similarities = self.st_util.cos_sim(response_emb, generic_embs)[0].cpu().numpy()
+            similarities = self.st_util.cos_sim(response_emb, self.generic_embs)[0].cpu().numpy()
             max_sim = float(similarities.max())
             most_similar_idx = int(similarities.argmax())
             is_generic = max_sim > 0.75  # threshold for generic/copy-paste
@@ -1,4 +1,5 @@
 import os
+import functools
 from transformers import DistilBertForSequenceClassification, DistilBertTokenizerFast
 import torch
 
@@ -11,6 +12,14 @@ class AnswerClassifier:
         self.model = DistilBertForSequenceClassification.from_pretrained(MODEL_DIR)
         self.model.to(self.device)
         self.model.eval()
+        if self.device.type == 'cuda':
+            # Half precision runs the GEMMs on tensor cores and halves weight traffic
+            self.model.half()
+        else:
+            # INT8 dynamic quantization of the Linear layers, which hold most of the
+            # weights and FLOPs; roughly 4x smaller and faster on CPU for a
+            # negligible change in the predicted probabilities
+            self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
 
     def predict(self, answer_text):
         inputs = self.tokenizer(
@@ -20,19 +29,23 @@ class AnswerClassifier:
             max_length=128,
             return_tensors='pt'
         )
+        # The inputs are a few KB and the forward pass needs them right away, so a
+        # plain copy beats staging them through freshly pinned memory
         inputs = {k: v.to(self.device) for k, v in inputs.items()}
-        with torch.no_grad():
+        with torch.inference_mode():
             outputs = self.model(**inputs)
-            probs = torch.softmax(outputs.logits, dim=1).cpu().numpy()[0]
-            pred_label = int(probs.argmax())
-            confidence = float(probs[pred_label])
+            probs = torch.softmax(outputs.logits.float(), dim=1).cpu().numpy()[0]
+        pred_label = int(probs.argmax())
         return {
             'label': pred_label,  # 1 = good, 0 = bad
-            'confidence': confidence
+            'confidence': float(probs[pred_label])
         }
 
-# Singleton instance for app-wide use
-classifier = AnswerClassifier()
+# Singleton instance for app-wide use, loaded on the first prediction rather
+# than at import so importing the routes doesn't pull the model into memory
+@functools.lru_cache(maxsize=1)
+def get_classifier():
+    return AnswerClassifier()
 
 def predict_answer_quality(answer_text):
-    return classifier.predict(answer_text)
+    return get_classifier().predict(answer_text)
@@ -4,7 +4,7 @@ import re
 import sys
 import os
 from datetime import datetime
-from flask import Blueprint, jsonify, request, g
+from flask import Blueprint, jsonify, request, g, current_app
 from flask import session
 from functools import wraps
 from ..db import get_db
@@ -16,6 +16,7 @@ from flask import abort
 from werkzeug.exceptions import HTTPException
 import json
 import random
+import functools
 from app.backend.utils.question_serving import get_random_question
 from app.backend.nlp.answer_classifier import predict_answer_quality
 from flask_cors import cross_origin
@@ -255,7 +256,8 @@ def generate_groq_question():
             cv_data=cv_data,
             model=model,
             is_new_session=is_new_session,
-            unique_id=unique_id
+            unique_id=unique_id,
+            session_id=session_id
         )
 
         print(f"Generated question: {question}")
@@ -637,6 +639,15 @@ def analyze_groq_response():
             'error': str(e)
         }), 500
 
+@functools.lru_cache(maxsize=1)
+def _groq_models_body():
+    """Serialize the /groq/models response once; the model list is fixed at import"""
+    return json.dumps({
+        'success': True,
+        'models': list(groq_client.AVAILABLE_MODEL_IDS),
+        'default_model': os.getenv("GROQ_DEFAULT_MODEL", "llama3-8b-8192")
+    }).encode('utf-8')
+
 @bp.route('/groq/models', methods=['GET'])
 @cross_origin(origins="http://localhost:3000", supports_credentials=True)
 def get_groq_models():
@@ -644,17 +655,7 @@ def get_groq_models():
     Get available Groq models
     """
     try:
-        models_data = groq_client.get_available_models()
-        default_model = os.getenv("GROQ_DEFAULT_MODEL", "llama3-8b-8192")
-
-        # Extract just the model IDs from the model objects
-        model_ids = [model["id"] for model in models_data]
-
-        return jsonify({
-            'success': True,
-            'models': model_ids,
-            'default_model': default_model
-        })
+        return current_app.response_class(_groq_models_body(), mimetype='application/json')
     except Exception as e:
         logging.error(f"Error getting Groq models: {str(e)}")
         return jsonify({
@@ -1,6 +1,9 @@
+import numpy as np
 import pandas as pd
 import random
 import os
+import re
+import functools
 import logging
 from typing import Optional
 
@@ -10,6 +13,7 @@ logger = logging.getLogger(__name__)
 
 # Load the cleaned master Q&A dataset once
 DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'master_questions_answers_cleaned.csv')
+PARQUET_PATH = os.path.splitext(DATA_PATH)[0] + '.parquet'
 
 # Default questions in case the data file doesn't exist
 DEFAULT_QUESTIONS = [
@@ -39,74 +43,130 @@ DEFAULT_QUESTIONS = [
     }
 ]
 
+_RNG = np.random.default_rng()
+
+# Columns kept resident for serving; the answer text is the largest column
+# and is loaded on demand by get_answer_for()
+SERVING_COLUMNS = ['question', 'category', 'difficulty', 'source']
+_answer_source = None
+
 # Try to load the data file, or use default questions if it doesn't exist
 try:
-    if os.path.exists(DATA_PATH):
-        df = pd.read_csv(DATA_PATH)
+    if os.path.exists(PARQUET_PATH):
+        df = pd.read_parquet(PARQUET_PATH, columns=SERVING_COLUMNS)
+        _answer_source = PARQUET_PATH
+        logger.info(f"Loaded {len(df)} questions from {PARQUET_PATH}")
+    elif os.path.exists(DATA_PATH):
+        df = pd.read_csv(DATA_PATH, usecols=SERVING_COLUMNS)
+        _answer_source = DATA_PATH
         logger.info(f"Loaded {len(df)} questions from {DATA_PATH}")
     else:
         logger.warning(f"Data file {DATA_PATH} not found. Using default questions.")
         df = pd.DataFrame(DEFAULT_QUESTIONS)
 except Exception as e:
     logger.error(f"Error loading question data: {e}")
+    _answer_source = None
     df = pd.DataFrame(DEFAULT_QUESTIONS)
 
+_df_answers = None if _answer_source else df['answer']
+df = df[SERVING_COLUMNS]
+
+def get_answer_for(idx):
+    """Get the model answer for the question at the given row index."""
+    global _df_answers
+    if _df_answers is None:
+        try:
+            if _answer_source == PARQUET_PATH:
+                _df_answers = pd.read_parquet(PARQUET_PATH, columns=['answer'])['answer']
+            else:
+                _df_answers = pd.read_csv(DATA_PATH, usecols=['answer'])['answer']
+        except Exception as e:
+            logger.error(f"Error loading answer data: {e}")
+            # Remember the failure so later calls don't re-read the file; every
+            # lookup in the empty Series returns None
+            _df_answers = pd.Series(dtype=object)
+    return _df_answers.get(idx)
+
+# Non-technical category keywords and behavioral question phrasings (expand as
+# needed), each matched as a substring in one pass
+_NON_TECHNICAL_CATEGORY_RE = re.compile(r'behavioral|situational|star', re.IGNORECASE)
+_BEHAVIORAL_QUESTION_RE = re.compile(r'tell me|describe|give an example|how did you', re.IGNORECASE)
+
 def get_technical_categories():
-    # Define non-technical categories (expand as needed)
-    non_technical_keywords = ['behavioral', 'situational', 'star']
     categories = df['category'].unique()
-    technical_categories = [cat for cat in categories if not any(kw in cat.lower() for kw in non_technical_keywords)]
+    technical_categories = [cat for cat in categories if not _NON_TECHNICAL_CATEGORY_RE.search(cat)]
     return technical_categories
 
-def get_random_question(category: Optional[str] = None, difficulty: Optional[str] = None, categories: Optional[list] = None):
+@functools.lru_cache(maxsize=256)
+def _bucket(cat_lower: Optional[str], diff_lower: Optional[str], cats_key: Optional[frozenset]) -> tuple:
+    """Get the row labels matching a filter; the random pick stays outside the cache."""
     filtered = df
-    if categories:
-        filtered = filtered[filtered['category'].isin(categories)]
-    elif category:
-        filtered = filtered[filtered['category'].str.lower() == category.lower()]
-    if difficulty:
-        filtered = filtered[filtered['difficulty'].str.lower() == difficulty.lower()]
-    if filtered.empty:
+    if cats_key:
+        filtered = filtered[filtered['category'].isin(cats_key)]
+    elif cat_lower:
+        filtered = filtered[filtered['category'].str.lower() == cat_lower]
+    if diff_lower:
+        filtered = filtered[filtered['difficulty'].str.lower() == diff_lower]
+    return tuple(filtered.index)
+
+def _pick_question(category: Optional[str] = None, difficulty: Optional[str] = None, categories: Optional[list] = None):
+    bucket = _bucket(
+        category.lower() if category else None,
+        difficulty.lower() if difficulty else None,
+        frozenset(categories) if categories else None
+    )
+    if not bucket:
         return None
-    row = filtered.sample(1).iloc[0]
+    idx = random.choice(bucket)
+    return idx, _build_question(idx)
+
+def _build_question(idx):
+    row = df.loc[idx]
     # Infer type from category or question text
-    cat = str(row['category']).lower()
-    qtext = str(row['question']).lower()
-    if any(word in cat for word in ['behavioral', 'situational', 'star']) or any(word in qtext for word in ['tell me', 'describe', 'give an example', 'how did you']):
+    if _NON_TECHNICAL_CATEGORY_RE.search(str(row['category'])) or _BEHAVIORAL_QUESTION_RE.search(str(row['question'])):
         qtype = 'behavioral'
     else:
         qtype = 'technical'
     return {
         'question': row['question'],
-        'answer': row['answer'],
         'category': row['category'],
         'difficulty': row['difficulty'],
         'source': row['source'],
         'type': qtype
     }
 
+def get_random_question(category: Optional[str] = None, difficulty: Optional[str] = None, categories: Optional[list] = None):
+    picked = _pick_question(category, difficulty, categories)
+    if picked is None:
+        return None
+    idx, question = picked
+    question['answer'] = get_answer_for(idx)
+    return question
+
+
+# Map API difficulty levels to dataset labels
+DIFFICULTY_MAP = {
+    'easy': 'beginner',
+    'medium': 'intermediate',
+    'hard': 'advanced'
+}
 
 def get_next_question(difficulty='easy'):
     """Get the next question based on difficulty level."""
-    # Map difficulty levels
-    difficulty_map = {
-        'easy': 'beginner',
-        'medium': 'intermediate',
-        'hard': 'advanced'
-    }
-
     # Use the mapped difficulty or default to beginner
-    mapped_difficulty = difficulty_map.get(difficulty, 'beginner')
+    mapped_difficulty = DIFFICULTY_MAP.get(difficulty, 'beginner')
 
     # Try to get a question with the specified difficulty
-    question = get_random_question(difficulty=mapped_difficulty)
+    # Answers are never returned here, so use the meta-only picker
+    picked = _pick_question(difficulty=mapped_difficulty)
 
     # If no question found, fall back to any difficulty
-    if not question:
-        question = get_random_question()
+    if not picked:
+        picked = _pick_question()
 
     # Format the question for the API response
-    if question:
+    if picked:
+        question = picked[1]
         return {
             'question': question['question'],
             'category': question['category'],
@@ -122,6 +182,28 @@ def get_next_question(difficulty='easy'):
         'type': 'behavioral'
     }
 
+def get_next_questions(n=5, difficulty='easy'):
+    """Get up to n distinct questions for a difficulty level in a single draw."""
+    bucket = _bucket(None, DIFFICULTY_MAP.get(difficulty, 'beginner'), None)
+
+    # If no question found, fall back to any difficulty
+    if not bucket:
+        bucket = _bucket(None, None, None)
+    if not bucket:
+        return []
+
+    idxs = _RNG.choice(bucket, size=min(n, len(bucket)), replace=False)
+    questions = []
+    for idx in idxs:
+        question = _build_question(idx)
+        questions.append({
+            'question': question['question'],
+            'category': question['category'],
+            'difficulty': difficulty,
+            'type': question['type']
+        })
+    return questions
+
 if __name__ == '__main__':
     # Demo: print a random question
     print(get_random_question())
@@ -129,3 +211,5 @@ if __name__ == '__main__':
     print(get_random_question(category='Computer Science > Programming', difficulty='beginner'))
     # Demo: get next question based on difficulty
     print(get_next_question('medium'))
+    # Demo: get a batch of questions for a session warm-up
+    print(get_next_questions(3, 'easy'))
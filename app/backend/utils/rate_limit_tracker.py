@@ -8,7 +8,8 @@ It maintains an in-memory cache of rate-limited clients to avoid unnecessary API
 import time
 import logging
 import threading
-from typing import Dict, Set, Tuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Set, Tuple
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -18,6 +19,11 @@ logger = logging.getLogger(__name__)
 _rate_limited_clients: Dict[str, Dict[str, float]] = {}
 _rate_limit_lock = threading.Lock()
 
+# Read-only snapshot handed out by get_rate_limited_clients().
+# Rebuilt only after the tracked state has changed.
+_snapshot: Mapping[str, Mapping[str, float]] = MappingProxyType({})
+_snapshot_stale = False
+
 # Default rate limit duration in seconds (1 hour)
 DEFAULT_RATE_LIMIT_DURATION = 3600
 
@@ -45,6 +51,7 @@ def is_rate_limited(client_ip: str, endpoint: str) -> bool:
             else:
                 # Rate limit has expired, remove it
                 del _rate_limited_clients[endpoint][client_ip]
+                _mark_snapshot_stale()
                 logger.info(f"Rate limit for client {client_ip} on {endpoint} has expired")
                 return False
         
@@ -67,9 +74,18 @@ def mark_rate_limited(client_ip: str, endpoint: str, duration: float = DEFAULT_R
         # Set expiration timestamp
         expiration = time.time() + duration
         _rate_limited_clients[endpoint][client_ip] = expiration
+        _mark_snapshot_stale()
         
         logger.warning(f"Client {client_ip} rate limited for {endpoint} until {time.ctime(expiration)}")
 
+def _mark_snapshot_stale() -> None:
+    """
+    Flag the read-only snapshot for rebuilding.
+    Must be called with the lock held whenever the tracked state changes.
+    """
+    global _snapshot_stale
+    _snapshot_stale = True
+
 def _cleanup_expired_rate_limits() -> None:
     """
     Clean up expired rate limits from the cache.
@@ -88,6 +104,7 @@ def _cleanup_expired_rate_limits() -> None:
         # Remove expired clients
         for client_ip in clients_to_remove:
             del clients[client_ip]
+            _mark_snapshot_stale()
         
         # If no clients left for this endpoint, mark for removal
         if not clients:
@@ -96,21 +113,42 @@ def _cleanup_expired_rate_limits() -> None:
     # Remove empty endpoints
     for endpoint in endpoints_to_remove:
         del _rate_limited_clients[endpoint]
+        _mark_snapshot_stale()
 
-def get_rate_limited_clients() -> Dict[str, Dict[str, float]]:
+def get_rate_limited_clients() -> Mapping[str, Mapping[str, float]]:
     """
     Get all currently rate limited clients.
     Useful for debugging and monitoring.
     
+    The result is a read-only view that is only rebuilt after the state
+    changes, so repeated calls don't copy every entry under the lock.
+    Use snapshot_copy() if a mutable copy is needed.
+    
     Returns:
-        Dict: A dictionary of rate limited clients by endpoint
+        Mapping: A read-only mapping of rate limited clients by endpoint
     """
+    global _snapshot, _snapshot_stale
     with _rate_limit_lock:
         # Clean up expired entries first
         _cleanup_expired_rate_limits()
         
-        # Return a copy to avoid thread safety issues
-        return {endpoint: clients.copy() for endpoint, clients in _rate_limited_clients.items()}
+        if _snapshot_stale:
+            _snapshot = MappingProxyType({
+                endpoint: MappingProxyType(clients.copy())
+                for endpoint, clients in _rate_limited_clients.items()
+            })
+            _snapshot_stale = False
+        
+        return _snapshot
+
+def snapshot_copy() -> Dict[str, Dict[str, float]]:
+    """
+    Get a mutable copy of all currently rate limited clients.
+    
+    Returns:
+        Dict: A dictionary of rate limited clients by endpoint
+    """
+    return {endpoint: dict(clients) for endpoint, clients in get_rate_limited_clients().items()}
 
 def clear_rate_limits(endpoint: str = None, client_ip: str = None) -> None:
     """
@@ -122,6 +160,8 @@ def clear_rate_limits(endpoint: str = None, client_ip: str = None) -> None:
         client_ip: The client IP to clear (optional)
     """
     with _rate_limit_lock:
+        _mark_snapshot_stale()
+        
         if endpoint is None and client_ip is None:
             # Clear all rate limits
             _rate_limited_clients.clear()
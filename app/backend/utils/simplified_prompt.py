@@ -68,26 +68,30 @@ def get_simplified_json_example():
 }
 """
 
+# Built once at import; every fallback response shares this dict
+_FALLBACK_RESPONSE = {
+    "reply": "Thank you for sharing your professional background. I appreciate your thoughtful response about your career journey so far. Let me ask you about your approach to professional development. Could you tell me about a time when you had to learn a new skill for your role? What motivated you to learn it, how did you approach the learning process, and how did you apply it in your work?",
+    "analysis": "Your response provided a good overview of your professional background. You shared some key experiences and skills that give me a better understanding of your qualifications. You could enhance your response by using more of the STAR framework to structure your answers.",
+    "strengths": [
+        "Clear communication of your professional journey and key experiences",
+        "Good articulation of your career motivations and interests"
+    ],
+    "improvement_tips": [
+        "Consider structuring your responses using the STAR method (Situation, Task, Action, Result) to make them more impactful",
+        "You could provide more specific examples that demonstrate your skills in action rather than just listing them"
+    ],
+    "star_scores": {
+        "Situation": 7,
+        "Task": 6,
+        "Action": 6,
+        "Result": 6
+    },
+    "overall_score": 6.5
+}
+
 def get_fallback_response():
     """
     Returns a fallback response when Ollama fails.
+    The dict is shared between calls, so callers must not modify it.
     """
-    return {
-        "reply": "Thank you for sharing your professional background. I appreciate your thoughtful response about your career journey so far. Let me ask you about your approach to professional development. Could you tell me about a time when you had to learn a new skill for your role? What motivated you to learn it, how did you approach the learning process, and how did you apply it in your work?",
-        "analysis": "Your response provided a good overview of your professional background. You shared some key experiences and skills that give me a better understanding of your qualifications. You could enhance your response by using more of the STAR framework to structure your answers.",
-        "strengths": [
-            "Clear communication of your professional journey and key experiences",
-            "Good articulation of your career motivations and interests"
-        ],
-        "improvement_tips": [
-            "Consider structuring your responses using the STAR method (Situation, Task, Action, Result) to make them more impactful",
-            "You could provide more specific examples that demonstrate your skills in action rather than just listing them"
-        ],
-        "star_scores": {
-            "Situation": 7,
-            "Task": 6,
-            "Action": 6,
-            "Result": 6
-        },
-        "overall_score": 6.5
-    }
+    return _FALLBACK_RESPONSE
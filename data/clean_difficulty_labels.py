@@ -1,4 +1,5 @@
 import pandas as pd
+from integrate_and_clean_datasets import integrate_all
 
 def standardize_difficulty(val):
     if pd.isnull(val):
@@ -13,12 +14,14 @@ def standardize_difficulty(val):
     else:
         return 'unknown'
 
-# Load the master Q&A file
-df = pd.read_csv('data/master_questions_answers.csv')
+# Build the master Q&A frame in memory instead of re-reading the CSV it was just written to
+df = integrate_all()
 df['difficulty'] = df['difficulty'].apply(standardize_difficulty)
 
-# Save cleaned file
+# Save cleaned file as Parquet (dictionary-encoded), plus CSV for external tools
+parquet_path = 'data/master_questions_answers_cleaned.parquet'
+df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
 cleaned_path = 'data/master_questions_answers_cleaned.csv'
 df.to_csv(cleaned_path, index=False)
-print(f'Cleaned difficulty labels. Saved to {cleaned_path}')
+print(f'Cleaned difficulty labels. Saved to {parquet_path} and {cleaned_path}')
 print(df['difficulty'].value_counts())
@@ -39,9 +39,10 @@ if 'difficulty' in df.columns and df['difficulty'].notnull().any():
     plt.savefig('data/difficulty_distribution.png')
     plt.close()
 
-# Show a few samples from each source
-for src in df['source'].unique():
+# Show a few samples from each source (single grouped pass instead of one mask per source)
+samples = df.groupby('source', sort=False).sample(3, random_state=42, replace=True)
+for src, group in samples.groupby('source', sort=False):
     print(f'\n--- SAMPLE Q&A FROM SOURCE: {src} ---')
-    print(df[df['source']==src][['question','answer','category','difficulty']].sample(3, random_state=42, replace=True))
+    print(group[['question','answer','category','difficulty']])
 
 print('\nEDA complete. Plots saved to data/.')
@@ -1,6 +1,12 @@
 import pandas as pd
 import json
 import os
+import gc
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Paths
 DATA_DIR = 'data'
@@ -14,24 +20,30 @@ def load_csvs():
         ('interview_val.csv', ','),
         ('interview_test.csv', ',')
     ]
-    dfs = {}
+    # Yield one file at a time so each source frame can be freed once standardized
     for fname, sep in files:
         path = os.path.join(DATA_DIR, fname)
         if os.path.exists(path):
             try:
-                dfs[fname] = pd.read_csv(path, sep=sep, encoding='utf-8')
+                yield fname, pd.read_csv(path, sep=sep, encoding='utf-8')
             except UnicodeDecodeError:
-                dfs[fname] = pd.read_csv(path, sep=sep, encoding='ISO-8859-1')
-    return dfs
+                yield fname, pd.read_csv(path, sep=sep, encoding='ISO-8859-1')
 
 # 2. Load JSON dataset
+# Fields used by standardize_mock_json; anything else in the records is never materialized
+MOCK_JSON_COLUMNS = ['question', 'answer', 'category', 'tier', 'source']
+
 def load_json():
     json_path = os.path.join(DATA_DIR, 'Mock_interview_questions.json')
     if os.path.exists(json_path):
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        # Assuming structure: {"questions": [ ... ]}
-        df = pd.json_normalize(data['questions'])
+        if orjson is not None:
+            with open(json_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        # Structure: {"questions": [ ... ]} with flat records, so no normalization needed
+        df = pd.DataFrame(data['questions'], columns=MOCK_JSON_COLUMNS)
         return df
     return None
 
@@ -73,31 +85,57 @@ def standardize_mock_json(df):
         ['question', 'answer', 'category', 'difficulty', 'source']
     ].assign(source='mock_json')
 
+def drop_duplicate_pairs(frames):
+    # Drop repeated (question, answer) pairs before concatenating, so the
+    # combined frame is only ever built once from unique rows
+    seen = set()
+    unique_frames = []
+    for df in frames:
+        keep = []
+        # Store the pairs themselves: a bare hash could collide and drop a distinct pair
+        for key in zip(df['question'], df['answer']):
+            keep.append(key not in seen)
+            seen.add(key)
+        unique_frames.append(df[keep])
+    return unique_frames
+
+SPLIT_FILES = ['interview_train.csv', 'interview_val.csv', 'interview_test.csv']
+
+def _dispatch_standardize(fname, df):
+    # Returns the standardized Q&A frame, or None for files that don't feed the master set
+    if fname == 'Software Questions.csv':
+        return standardize_software_questions(df)
+    if fname == 'tester-interview-questions-and-answers.csv':
+        return standardize_tester_questions(df)
+    if fname in SPLIT_FILES:
+        # Save train/val/test sets as cleaned versions
+        std = standardize_train_val_test(df, source=fname.replace('.csv',''))
+        std.to_csv(os.path.join(DATA_DIR, f'cleaned_{fname}'), index=False)
+    return None
+
 # 4. Main integration function
 def integrate_all():
-    dfs = load_csvs()
-    mock_df = load_json()
     all_rows = []
-    # Standardize and collect
-    if 'Software Questions.csv' in dfs:
-        all_rows.append(standardize_software_questions(dfs['Software Questions.csv']))
-    if 'tester-interview-questions-and-answers.csv' in dfs:
-        all_rows.append(standardize_tester_questions(dfs['tester-interview-questions-and-answers.csv']))
+    # Standardize and collect, dropping each source frame as soon as it's done
+    for fname, df in load_csvs():
+        std = _dispatch_standardize(fname, df)
+        if std is not None:
+            all_rows.append(std)
+        del df, std
+    mock_df = load_json()
     if mock_df is not None:
         all_rows.append(standardize_mock_json(mock_df))
+        del mock_df
+    gc.collect()
     # Merge all Q&A for question serving/model answers
-    master_qa = pd.concat(all_rows, ignore_index=True)
+    master_qa = pd.concat(drop_duplicate_pairs(all_rows), ignore_index=True)
     # Save master Q&A
     master_qa.to_csv(os.path.join(DATA_DIR, 'master_questions_answers.csv'), index=False)
-    # Save train/val/test sets as cleaned versions
-    for split in ['interview_train.csv', 'interview_val.csv', 'interview_test.csv']:
-        if split in dfs:
-            std = standardize_train_val_test(dfs[split], source=split.replace('.csv',''))
-            std.to_csv(os.path.join(DATA_DIR, f'cleaned_{split}'), index=False)
     print('Integration and cleaning complete!')
     print(f'Master Q&A shape: {master_qa.shape}')
     print('Sample rows:')
     print(master_qa.head())
+    return master_qa
 
 if __name__ == '__main__':
     integrate_all()
@@ -1,7 +1,8 @@
+import numpy as np
 import pandas as pd
 from sklearn.model_selection import train_test_split
-import glob
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # List all labeled answer datasets to merge (update this list as needed)
 DATA_FILES = [
@@ -15,57 +16,97 @@ DATA_FILES = [
     'master_questions_answers_cleaned.csv',
 ]
 
+# Column names recognised as answer text and as the label
+ANSWER_COLS = {'answer', 'response', 'user_answer', 'user_response'}
+LABEL_COLS = {'label', 'quality', 'is_good', 'is_bad', 'good', 'bad', 'score'}
+# Fallback mapping for labels that aren't plain integers
+LABEL_MAP = {'good': 1, 'bad': 0, '1': 1, '0': 0}
+
 DATA_DIR = os.path.dirname(__file__)
-all_dfs = []
+# Rows parsed per read_csv chunk
+CHUNK_SIZE = 50_000
+# Files read concurrently; the C CSV parser releases the GIL
+MAX_WORKERS = 8
 
-for fname in DATA_FILES:
+def load_one(fname):
+    """Load the answer/label columns of one dataset file, or None if it can't be used."""
     fpath = os.path.join(DATA_DIR, fname)
-    if os.path.exists(fpath):
-        try:
-            df = pd.read_csv(fpath)
-            # Only keep columns relevant for answer training (adjust as needed)
-            # Try to find columns for answer text and label
-            answer_col = None
-            label_col = None
-            for col in df.columns:
-                if col.lower() in ['answer', 'response', 'user_answer', 'user_response']:
-                    answer_col = col
-                if col.lower() in ['label', 'quality', 'is_good', 'is_bad', 'good', 'bad', 'score']:
-                    label_col = col
-            if answer_col is not None and label_col is not None:
-                df = df[[answer_col, label_col]].rename(columns={answer_col: 'answer', label_col: 'label'})
-                all_dfs.append(df)
-        except Exception as e:
-            print(f"Could not process {fname}: {e}")
+    if not os.path.exists(fpath):
+        return None
+    try:
+        # Read only the header first to find columns for answer text and label
+        header = pd.read_csv(fpath, nrows=0).columns
+        answer_col = next((c for c in header if c.lower() in ANSWER_COLS), None)
+        label_col = next((c for c in header if c.lower() in LABEL_COLS), None)
+        if answer_col is None or label_col is None:
+            return None
+        # Only parse the columns relevant for answer training, in chunks to bound peak memory.
+        # Labels keep their inferred dtype so numeric labels like 1.0 stay numeric
+        reader = pd.read_csv(
+            fpath,
+            usecols=[answer_col, label_col],
+            dtype={answer_col: 'string'},
+            chunksize=CHUNK_SIZE
+        )
+        chunks = [
+            chunk.rename(columns={answer_col: 'answer', label_col: 'label'}).dropna().drop_duplicates(subset='answer')
+            for chunk in reader
+        ]
+        # Dedupe each file before it joins the global concat
+        df = pd.concat(chunks, ignore_index=True, copy=False)
+        return df.drop_duplicates(subset=['answer'])
+    except Exception as e:
+        print(f"Could not process {fname}: {e}")
+        return None
+
+# map() keeps DATA_FILES order, so cross-file dedup still keeps the first file's row
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+    all_dfs = [df for df in ex.map(load_one, DATA_FILES) if df is not None]
 
 if not all_dfs:
     raise RuntimeError("No datasets could be loaded. Check DATA_FILES paths and format.")
 
 # Concatenate all data
-merged_df = pd.concat(all_dfs, ignore_index=True)
+merged_df = pd.concat(all_dfs, ignore_index=True, copy=False)
 
-# Drop rows with missing values or duplicates
-merged_df = merged_df.dropna().drop_duplicates()
+# Files are already free of missing values and internal duplicates; drop duplicates across files
+merged_df = merged_df.drop_duplicates(subset=['answer'], keep='first')
 
 # Shuffle
 merged_df = merged_df.sample(frac=1, random_state=42).reset_index(drop=True)
 
-# Convert label to int if possible
-try:
-    merged_df['label'] = merged_df['label'].astype(int)
-except Exception:
-    # If not int, try to map good/bad to 1/0
-    merged_df['label'] = merged_df['label'].astype(str).map({'good': 1, 'bad': 0, '1': 1, '0': 0})
+# Parse labels as numbers first (1, 1.0, "1" all count), whatever dtype each file gave them
+labels = pd.to_numeric(merged_df['label'], errors='coerce')
+unparsed = labels.isna().to_numpy()
+if unparsed.any():
+    # Map the rest (good/bad) once per distinct label, then gather by code
+    cats = merged_df['label'][unparsed].astype(str).astype('category')
+    mapping = np.array([LABEL_MAP.get(c, np.nan) for c in cats.cat.categories], dtype=np.float64)
+    labels[unparsed] = mapping[cats.cat.codes.to_numpy()]
+merged_df['label'] = labels
+
+# Only 0/1 labels can be used for binary training: drop labels that don't map to
+# good/bad, and numeric labels from other scales (1-5 ratings, -1/1)
+unrecognised = labels.isna().to_numpy()
+non_binary = ~unrecognised & ~labels.isin((0, 1)).to_numpy()
+if unrecognised.any():
+    print(f"Dropping {int(unrecognised.sum())} rows with unrecognised labels")
+if non_binary.any():
+    print(f"Dropping {int(non_binary.sum())} rows with labels other than 0/1")
+merged_df = merged_df[~(unrecognised | non_binary)]
+
+# Store labels as int8 to keep the split/shuffle copies small
+merged_df['label'] = merged_df['label'].astype('int8')
 
-# Split
-train_df, temp_df = train_test_split(merged_df, test_size=0.2, random_state=42, stratify=merged_df['label'])
-val_df, test_df = train_test_split(temp_df, test_size=0.5, random_state=42, stratify=temp_df['label'])
+# Split (stratify on the int8 label array so sklearn takes its numeric path)
+train_df, temp_df = train_test_split(merged_df, test_size=0.2, random_state=42, stratify=merged_df['label'].to_numpy())
+val_df, test_df = train_test_split(temp_df, test_size=0.5, random_state=42, stratify=temp_df['label'].to_numpy())
 
-# Save
-train_df.to_csv(os.path.join(DATA_DIR, 'all_answers_train.csv'), index=False)
-val_df.to_csv(os.path.join(DATA_DIR, 'all_answers_val.csv'), index=False)
-test_df.to_csv(os.path.join(DATA_DIR, 'all_answers_test.csv'), index=False)
+# Save as Parquet so dtypes survive the round trip into training
+train_df.to_parquet(os.path.join(DATA_DIR, 'all_answers_train.parquet'), index=False, compression='snappy')
+val_df.to_parquet(os.path.join(DATA_DIR, 'all_answers_val.parquet'), index=False, compression='snappy')
+test_df.to_parquet(os.path.join(DATA_DIR, 'all_answers_test.parquet'), index=False, compression='snappy')
 
 print(f"Merged dataset size: {len(merged_df)}")
 print(f"Train: {len(train_df)}, Val: {len(val_df)}, Test: {len(test_df)}")
-print("Saved to all_answers_train.csv, all_answers_val.csv, all_answers_test.csv")
+print("Saved to all_answers_train.parquet, all_answers_val.parquet, all_answers_test.parquet")
@@ -1,92 +1,161 @@
+import hashlib
+import os
+import numpy as np
 import pandas as pd
 import torch
-from transformers import DistilBertTokenizerFast, DistilBertForSequenceClassification, Trainer, TrainingArguments
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, precision_recall_fscore_support
-
-# 1. Load Data
-train_df = pd.read_csv('data/all_answers_train.csv')
-val_df = pd.read_csv('data/all_answers_val.csv')
-test_df = pd.read_csv('data/all_answers_test.csv')
-
-# 2. Prepare Data (use 'response' as input, 'label' as target)
-train_texts = train_df['answer'].astype(str).tolist()
-train_labels = train_df['label'].astype(int).tolist()
-val_texts = val_df['answer'].astype(str).tolist()
-val_labels = val_df['label'].astype(int).tolist()
-test_texts = test_df['answer'].astype(str).tolist()
-test_labels = test_df['label'].astype(int).tolist()
-
-# 3. Tokenization
-model_name = 'distilbert-base-uncased'
-tokenizer = DistilBertTokenizerFast.from_pretrained(model_name)
+from transformers import DistilBertTokenizerFast, DistilBertForSequenceClassification, Trainer, TrainingArguments, DataCollatorWithPadding
+from transformers.utils import is_torch_tf32_available
 
-def tokenize(texts):
-    return tokenizer(texts, truncation=True, padding=True, max_length=128)
+model_name = 'distilbert-base-uncased'
+MAX_LENGTH = 128
+CACHE_DIR = 'data/cache'
+# Larger batches keep the tensor cores busy at MAX_LENGTH=128; if a GPU runs out
+# of memory, halve BATCH_SIZE and double ACCUM_STEPS to keep the effective batch
+BATCH_SIZE = 32
+ACCUM_STEPS = 1
 
-train_encodings = tokenize(train_texts)
-val_encodings = tokenize(val_texts)
-test_encodings = tokenize(test_texts)
+def tokenize(tokenizer, texts, split):
+    # Tokenize once and cache the padded arrays; the key changes whenever the texts do
+    key_src = '\n'.join([model_name, str(MAX_LENGTH)] + texts)
+    key = hashlib.sha1(key_src.encode('utf-8')).hexdigest()[:16]
+    ids_path = os.path.join(CACHE_DIR, f'{split}_{key}_input_ids.npy')
+    mask_path = os.path.join(CACHE_DIR, f'{split}_{key}_attention_mask.npy')
+    if os.path.exists(ids_path) and os.path.exists(mask_path):
+        return np.load(ids_path), np.load(mask_path)
+    # Tokenize each distinct answer once, then gather rows back by code
+    codes, uniques = pd.factorize(pd.Series(texts))
+    encodings = tokenizer(list(uniques), truncation=True, padding='max_length', max_length=MAX_LENGTH)
+    codes = codes.astype(np.int32)
+    input_ids = np.asarray(encodings['input_ids'], dtype=np.int32)[codes]
+    attention_mask = np.asarray(encodings['attention_mask'], dtype=np.int32)[codes]
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    np.save(ids_path, input_ids)
+    np.save(mask_path, attention_mask)
+    return input_ids, attention_mask
 
 class InterviewDataset(torch.utils.data.Dataset):
     def __init__(self, encodings, labels):
-        self.encodings = encodings
-        self.labels = labels
+        # Build the tensors once so __getitem__ only indexes
+        input_ids, attention_mask = encodings
+        self.input_ids = torch.from_numpy(input_ids).long()
+        self.attention_mask = torch.from_numpy(attention_mask).long()
+        self.labels = torch.as_tensor(labels, dtype=torch.long)
+        # Real (unpadded) token counts; items are trimmed so the collator pads per batch
+        self.lengths = attention_mask.sum(axis=1).tolist()
     def __getitem__(self, idx):
-        item = {key: torch.tensor(val[idx]) for key, val in self.encodings.items()}
-        item['labels'] = torch.tensor(self.labels[idx])
-        return item
+        length = self.lengths[idx]
+        return {
+            'input_ids': self.input_ids[idx, :length],
+            'attention_mask': self.attention_mask[idx, :length],
+            'labels': self.labels[idx]
+        }
     def __len__(self):
         return len(self.labels)
 
-train_dataset = InterviewDataset(train_encodings, train_labels)
-val_dataset = InterviewDataset(val_encodings, val_labels)
-test_dataset = InterviewDataset(test_encodings, test_labels)
+def compute_metrics(pred):
+    labels = np.asarray(pred.label_ids, dtype=np.int64)
+    preds = pred.predictions.argmax(-1)
+    # Binary confusion matrix in one pass: rows are labels, columns are predictions
+    cm = np.bincount(2 * labels + preds, minlength=4).reshape(2, 2)
+    tn, fp, fn, tp = cm.ravel()
+    acc = (tp + tn) / cm.sum()
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {'accuracy': float(acc), 'precision': float(precision), 'recall': float(recall), 'f1': float(f1)}
+
+# Everything that does work runs in main(): DataLoader workers on spawn platforms
+# (Windows, macOS) re-import this module and must not retrain on import
+def main():
+    # 1. Load Data
+    train_df = pd.read_parquet('data/all_answers_train.parquet')
+    val_df = pd.read_parquet('data/all_answers_val.parquet')
+    test_df = pd.read_parquet('data/all_answers_test.parquet')
 
-# 4. Model
-model = DistilBertForSequenceClassification.from_pretrained(model_name, num_labels=2)
+    # 2. Prepare Data (use 'response' as input, 'label' as target)
+    # Parquet keeps the string/int8 dtypes, so no re-casting is needed
+    train_texts = train_df['answer'].tolist()
+    train_labels = train_df['label'].tolist()
+    val_texts = val_df['answer'].tolist()
+    val_labels = val_df['label'].tolist()
+    test_texts = test_df['answer'].tolist()
+    test_labels = test_df['label'].tolist()
 
-# 5. Metrics
+    # 3. Tokenization
+    tokenizer = DistilBertTokenizerFast.from_pretrained(model_name)
+    train_encodings = tokenize(tokenizer, train_texts, 'train')
+    val_encodings = tokenize(tokenizer, val_texts, 'val')
+    test_encodings = tokenize(tokenizer, test_texts, 'test')
 
-def compute_metrics(pred):
-    labels = pred.label_ids
-    preds = pred.predictions.argmax(-1)
-    acc = accuracy_score(labels, preds)
-    precision, recall, f1, _ = precision_recall_fscore_support(labels, preds, average='binary')
-    return {'accuracy': acc, 'precision': precision, 'recall': recall, 'f1': f1}
-
-# 6. Training Arguments
-training_args = TrainingArguments(
-    output_dir='./results',
-    num_train_epochs=2,
-    per_device_train_batch_size=8,
-    per_device_eval_batch_size=8,
-    eval_strategy='epoch',
-    save_strategy='epoch',
-    logging_dir='./logs',
-    logging_steps=20,
-    load_best_model_at_end=True,
-    metric_for_best_model='f1',
-    greater_is_better=True
-)
-
-# 7. Trainer
-trainer = Trainer(
-    model=model,
-    args=training_args,
-    train_dataset=train_dataset,
-    eval_dataset=val_dataset,
-    compute_metrics=compute_metrics,
-)
-
-# 8. Train
-trainer.train()
-
-# 9. Evaluate on test set
-results = trainer.evaluate(test_dataset)
-print('Test set results:', results)
-
-# 10. Save the model
-model.save_pretrained('data/answer_classifier_model')
-tokenizer.save_pretrained('data/answer_classifier_model')
-print('Model and tokenizer saved to data/answer_classifier_model')
+    train_dataset = InterviewDataset(train_encodings, train_labels)
+    val_dataset = InterviewDataset(val_encodings, val_labels)
+    test_dataset = InterviewDataset(test_encodings, test_labels)
+
+    # 4. Model
+    model = DistilBertForSequenceClassification.from_pretrained(model_name, num_labels=2)
+    # Dynamic padding gives one graph per padded length (multiples of 8 up to MAX_LENGTH)
+    torch._dynamo.config.cache_size_limit = 64
+
+    # 6. Training Arguments
+    # Mixed precision: bf16 where supported, fp16 on older GPUs, full fp32 on CPU
+    use_bf16 = torch.cuda.is_available() and torch.cuda.is_bf16_supported()
+    use_fp16 = torch.cuda.is_available() and not use_bf16
+
+    training_args = TrainingArguments(
+        output_dir='./results',
+        num_train_epochs=2,
+        per_device_train_batch_size=BATCH_SIZE,
+        per_device_eval_batch_size=2 * BATCH_SIZE,
+        gradient_accumulation_steps=ACCUM_STEPS,
+        eval_strategy='epoch',
+        save_strategy='epoch',
+        # Epoch checkpoints only feed load_best_model_at_end, so skip the optimizer and
+        # scheduler state and keep just the best and latest ones on disk
+        save_only_model=True,
+        save_total_limit=2,
+        logging_dir='./logs',
+        logging_steps=20,
+        load_best_model_at_end=True,
+        metric_for_best_model='f1',
+        greater_is_better=True,
+        # Batch answers of similar length together to cut padding further
+        group_by_length=True,
+        # Fuse kernels with torch.compile on GPU; Trainer unwraps the compiled module when saving
+        torch_compile=torch.cuda.is_available(),
+        # Collate in worker processes and overlap host-to-device copies with compute
+        dataloader_num_workers=4,
+        dataloader_pin_memory=True,
+        dataloader_persistent_workers=True,
+        dataloader_prefetch_factor=4,
+        # One fused AdamW kernel over all parameters on GPU instead of a per-tensor loop
+        optim='adamw_torch_fused' if torch.cuda.is_available() else 'adamw_torch',
+        bf16=use_bf16,
+        fp16=use_fp16,
+        tf32=is_torch_tf32_available()
+    )
+
+    # 7. Trainer
+    trainer = Trainer(
+        model=model,
+        args=training_args,
+        train_dataset=train_dataset,
+        eval_dataset=val_dataset,
+        compute_metrics=compute_metrics,
+        # Pad each batch to its own longest item (multiple of 8 for tensor cores)
+        data_collator=DataCollatorWithPadding(tokenizer, pad_to_multiple_of=8),
+    )
+
+    # 8. Train
+    trainer.train()
+
+    # 9. Evaluate on test set
+    results = trainer.evaluate(test_dataset)
+    print('Test set results:', results)
+
+    # 10. Save the model
+    model.save_pretrained('data/answer_classifier_model')
+    tokenizer.save_pretrained('data/answer_classifier_model')
+    print('Model and tokenizer saved to data/answer_classifier_model')
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 import sys
 import logging
 import os
+import functools
 
 # Configure logging to print to console
 logging.basicConfig(
@@ -11,27 +12,37 @@ logging.basicConfig(
     ]
 )
 
-# Print environment variables for debugging
-print(f"GROQ_API_KEY: {os.environ.get('GROQ_API_KEY', 'Not set')[:5]}...{os.environ.get('GROQ_API_KEY', 'Not set')[-5:] if os.environ.get('GROQ_API_KEY') else ''}")
-print(f"GROQ_DEFAULT_MODEL: {os.environ.get('GROQ_DEFAULT_MODEL', 'Not set')}")
-
-print(f"__name__ is: {__name__}")
 from app.backend import create_app
 
-print("Creating app...")
-try:
-    app = create_app()
-    print("App created!")
+@functools.lru_cache(maxsize=None)
+def get_app():
+    """Create the Flask app on first use and reuse it afterwards."""
     # CORS is already configured in create_app()
-except Exception as e:
-    print("Exception during create_app:", e)
-    sys.exit(1)
+    return create_app()
 
 if __name__ == '__main__':
-    print("Starting Flask server...")
+    # Print environment variables for debugging
+    print(f"GROQ_API_KEY: {os.environ.get('GROQ_API_KEY', 'Not set')[:5]}...{os.environ.get('GROQ_API_KEY', 'Not set')[-5:] if os.environ.get('GROQ_API_KEY') else ''}")
+    print(f"GROQ_DEFAULT_MODEL: {os.environ.get('GROQ_DEFAULT_MODEL', 'Not set')}")
+
+    print("Creating app...")
+    try:
+        app = get_app()
+        print("App created!")
+    except Exception as e:
+        print("Exception during create_app:", e)
+        sys.exit(1)
+
     try:
-        # Enable debug mode for more verbose output
-        app.run(debug=True)
+        if os.environ.get('FLASK_ENV') == 'development':
+            print("Starting Flask development server...")
+            # Enable debug mode for more verbose output
+            app.run(debug=True)
+        else:
+            # The built-in server is not meant for production traffic; prefer a WSGI server, e.g.
+            #   gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5000 --capture-output wsgi:app
+            print("Starting Flask server without debug mode (use gunicorn with wsgi:app in production)...")
+            app.run(debug=False, threaded=True)
     except Exception as e:
         print("Exception during app.run:", e)
         sys.exit(1)
@@ -14,22 +14,22 @@ import uuid
 import random
 import logging
 import re
+import string
+import asyncio
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from itertools import islice
+from types import MappingProxyType
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
-# Import the OpenAI library for interacting with the Groq API
 try:
-    from openai import OpenAI
+    import orjson
 except ImportError:
-    print("OpenAI library not found. Installing...")
-    try:
-        import subprocess
-        subprocess.check_call(["pip", "install", "openai", "--user"])
-        from openai import OpenAI
-    except Exception as e:
-        print(f"Error installing openai: {e}")
-        print("Please install openai manually using: pip install openai --user")
+    orjson = None
 
 # Load environment variables
 load_dotenv()
@@ -50,23 +50,49 @@ if GROQ_API_KEY:
 else:
     logger.warning("GROQ_API_KEY not set")
 
+# Without an API key every request is served by generate_mock_response
+_USE_MOCK = not GROQ_API_KEY
+
 logger.info(f"GROQ_API_BASE: {GROQ_API_BASE}")
 logger.info(f"DEFAULT_MODEL: {DEFAULT_MODEL}")
 
 # Create OpenAI client for Groq API
+# Cached so the underlying HTTP connection pool is reused across requests
+@functools.lru_cache(maxsize=1)
 def get_client():
     """Get an OpenAI client configured for Groq API"""
     if not GROQ_API_KEY:
         logger.warning("No Groq API key found")
         return None
 
+    # Imported here so mock-only deployments never load openai (see requirements.txt)
+    from openai import OpenAI
+
     return OpenAI(
         api_key=GROQ_API_KEY,
         base_url=GROQ_API_BASE
     )
 
+def reset_client():
+    """Drop the cached Groq client (e.g. after changing settings in tests)"""
+    get_client.cache_clear()
+
+def _new_async_client():
+    """Create an AsyncOpenAI client for Groq API; the caller owns it and must close it"""
+    import httpx
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(
+        api_key=GROQ_API_KEY,
+        base_url=GROQ_API_BASE,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=30
+        )
+    )
+
 # Available Groq models
-AVAILABLE_MODELS = [
+_MODELS_RAW = [
     {"id": "llama3-8b-8192", "name": "Llama 3 8B"},
     {"id": "llama3-70b-8192", "name": "Llama 3 70B"},
     {"id": "mixtral-8x7b-32768", "name": "Mixtral 8x7B"},
@@ -76,19 +102,108 @@ AVAILABLE_MODELS = [
     {"id": "claude-3-haiku-20240307", "name": "Claude 3 Haiku"}
 ]
 
+# Read-only views so callers can't mutate the shared list
+AVAILABLE_MODELS = tuple(MappingProxyType(m) for m in _MODELS_RAW)
+AVAILABLE_MODEL_IDS = tuple(m["id"] for m in _MODELS_RAW)
+
 def get_available_models():
     """
     Get available Groq models
 
     Returns:
-        List of available models
+        Read-only tuple of available models
     """
     return AVAILABLE_MODELS
 
+# Per-thread random generators so concurrent requests don't share one generator state
+_tls = threading.local()
+
+def _rng() -> random.Random:
+    """Get this thread's random generator, seeding it from the OS on first use"""
+    rng = getattr(_tls, "rng", None)
+    if rng is None:
+        rng = _tls.rng = random.Random(os.urandom(16))
+    return rng
+
+# Response cache storage
+_RESPONSE_CACHE: "OrderedDict[bytes, tuple]" = OrderedDict()  # {key: (timestamp, response)}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+RESPONSE_CACHE_MAXSIZE = 2048
+RESPONSE_CACHE_TTL = 3600  # seconds
+
+def _get_cached_response(key: Optional[bytes]) -> Optional[str]:
+    """Get a cached response, or None if missing or expired"""
+    if key is None:
+        return None
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(key)
+        if entry is None:
+            return None
+        timestamp, response = entry
+        if time.time() - timestamp > RESPONSE_CACHE_TTL:
+            del _RESPONSE_CACHE[key]
+            return None
+        _RESPONSE_CACHE.move_to_end(key)
+        return response
+
+def _set_cached_response(key: Optional[bytes], response: str) -> None:
+    """Store a response, evicting the least recently used entries past the size bound"""
+    if key is None or not response:
+        return
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[key] = (time.time(), response)
+        _RESPONSE_CACHE.move_to_end(key)
+        while len(_RESPONSE_CACHE) > RESPONSE_CACHE_MAXSIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+
+def clear_response_cache():
+    """Drop all cached Groq responses"""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+
+def _hash_text(text: str) -> bytes:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+# Questions are 1-2 sentences, so streamed question requests get a small token budget.
+# The stream ends once the question (and any sentence completing it) is in, or at this
+# budget; there is no blank-line stop sequence since replies often put a lead-in
+# before a blank line
+QUESTION_MAX_TOKENS = 160
+
+# End of the sentence that follows a question on the same line, or the line break
+_FOLLOW_ON_END_RE = re.compile(r'[.?!](?=\s)|\n')
+
+def _complete_question(buf: str) -> Optional[str]:
+    """
+    Get the complete question once it has arrived, or None to keep reading
+
+    A question ends at its first real question mark, unless another sentence
+    follows on the same line ("What is X? Explain how you'd use it."), in
+    which case that sentence is part of the question too.
+    """
+    end = buf.find('?')
+    if end < 20:
+        # Either no question yet, or a "?" too early to be a full question
+        end = buf.find('?', 20)
+    if end == -1:
+        return None
+    rest = buf[end + 1:]
+    following = rest.lstrip(' \t')
+    if not following:
+        # Can't tell yet whether another sentence follows
+        return None
+    if following[0] in '\r\n':
+        return buf[:end + 1]
+    match = _FOLLOW_ON_END_RE.search(rest)
+    return buf[:end + 1 + match.end()] if match else None
+
 def send_message(
     message: str,
     model: str = DEFAULT_MODEL,
-    context: List[Dict[str, str]] = None
+    context: List[Dict[str, str]] = None,
+    cache_key: Optional[bytes] = None,
+    stop_on_question: bool = False,
+    system: str = None
 ) -> str:
     """
     Send a message to Groq API and get a response
@@ -97,6 +212,9 @@ def send_message(
         message: The user message to send
         model: The model to use (defaults to DEFAULT_MODEL)
         context: Optional previous messages for context
+        cache_key: Optional key to serve/store the response from the response cache
+        stop_on_question: Stream the response and stop reading once a full question arrives
+        system: Optional system prompt, sent first so providers can cache it as a prefix
 
     Returns:
         The AI response as a string
@@ -104,46 +222,202 @@ def send_message(
     logger.info(f"Groq API: Sending message to model {model}")
 
     # Check if we have a valid API key
-    if not GROQ_API_KEY:
+    if _USE_MOCK:
         logger.warning("No Groq API key found. Using mock response.")
         return generate_mock_response(message, model)
 
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        logger.info("Groq API: Serving response from cache")
+        return cached
+
     try:
         client = get_client()
 
-        # Prepare the messages in the format expected by the OpenAI API
-        messages = []
-
-        # Add context messages if provided
-        if context:
-            for msg in context:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                messages.append({"role": role, "content": content})
-
-        # Add the current message
-        messages.append({"role": "user", "content": message})
-
-        # Call the API
-        response = client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=0.7,
-            max_tokens=1024
-        )
+        if stop_on_question:
+            stream = client.chat.completions.create(
+                model=model,
+                messages=build_messages(message, context, system),
+                temperature=0.7,
+                max_tokens=QUESTION_MAX_TOKENS,
+                stream=True
+            )
+            buf = ""
+            try:
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        buf += chunk.choices[0].delta.content
+                    question = _complete_question(buf)
+                    if question:
+                        buf = question
+                        break
+            finally:
+                # Closing the stream early tells Groq to stop generating
+                stream.close()
+            response_text = buf
+        else:
+            # Call the API
+            response = client.chat.completions.create(
+                model=model,
+                messages=build_messages(message, context, system),
+                temperature=0.7,
+                max_tokens=1024
+            )
 
-        # Extract the response text
-        response_text = response.choices[0].message.content
+            # Extract the response text
+            response_text = response.choices[0].message.content
 
         # Clean up the response
         cleaned_response = response_text.strip()
 
+        _set_cached_response(cache_key, cleaned_response)
+        return cleaned_response
+
+    except Exception as e:
+        logger.error(f"Error using Groq API: {str(e)}")
+        logger.info("Falling back to mock response")
+        return generate_mock_response(message, model)
+
+async def send_message_async(
+    message: str,
+    model: str = DEFAULT_MODEL,
+    context: List[Dict[str, str]] = None,
+    cache_key: Optional[bytes] = None,
+    stop_on_question: bool = False,
+    system: str = None,
+    client=None
+) -> str:
+    """
+    Send a message to Groq API without blocking the event loop
+
+    Args:
+        message: The user message to send
+        model: The model to use (defaults to DEFAULT_MODEL)
+        context: Optional previous messages for context
+        cache_key: Optional key to serve/store the response from the response cache
+        stop_on_question: Stream the response and stop reading once a full question arrives
+        system: Optional system prompt, sent first so providers can cache it as a prefix
+        client: Optional AsyncOpenAI client to send with; without one, a client is
+            created for this call and closed before returning
+
+    Returns:
+        The AI response as a string
+    """
+    logger.info(f"Groq API: Sending async message to model {model}")
+
+    # Check if we have a valid API key
+    if _USE_MOCK:
+        logger.warning("No Groq API key found. Using mock response.")
+        return generate_mock_response(message, model)
+
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        logger.info("Groq API: Serving response from cache")
+        return cached
+
+    # httpx connection pools are tied to the loop that opened them, so async
+    # clients are scoped to a call (or a batch) and always closed, never shared
+    owns_client = client is None
+    try:
+        if owns_client:
+            client = _new_async_client()
+
+        if stop_on_question:
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=build_messages(message, context, system),
+                temperature=0.7,
+                max_tokens=QUESTION_MAX_TOKENS,
+                stream=True
+            )
+            buf = ""
+            try:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        buf += chunk.choices[0].delta.content
+                    question = _complete_question(buf)
+                    if question:
+                        buf = question
+                        break
+            finally:
+                await stream.close()
+            cleaned_response = buf.strip()
+        else:
+            # Call the API
+            response = await client.chat.completions.create(
+                model=model,
+                messages=build_messages(message, context, system),
+                temperature=0.7,
+                max_tokens=1024
+            )
+
+            # Extract and clean up the response text
+            cleaned_response = response.choices[0].message.content.strip()
+
+        _set_cached_response(cache_key, cleaned_response)
         return cleaned_response
 
     except Exception as e:
         logger.error(f"Error using Groq API: {str(e)}")
         logger.info("Falling back to mock response")
         return generate_mock_response(message, model)
+    finally:
+        if owns_client and client is not None:
+            await client.close()
+
+def build_messages(
+    message: str,
+    context: List[Dict[str, str]] = None,
+    system: str = None
+) -> List[Dict[str, str]]:
+    """
+    Prepare the messages in the format expected by the OpenAI API
+
+    Args:
+        message: The user message to send
+        context: Optional previous messages for context
+        system: Optional system prompt, placed before everything else
+
+    Returns:
+        List of role/content message dicts
+    """
+    messages = []
+
+    if system:
+        messages.append({"role": "system", "content": system})
+
+    # Add context messages if provided
+    if context:
+        for msg in context:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+            messages.append({"role": role, "content": content})
+
+    # Add the current message
+    messages.append({"role": "user", "content": message})
+
+    return messages
+
+# Mock replies used when the API is unavailable
+_MOCK_QUESTIONS = (
+    "Can you tell me about a time when you had to work under pressure to meet a deadline?",
+    "When you have multiple deadlines, how do you typically prioritize your work?",
+    "What would you say is your greatest professional achievement so far?",
+    "Have you ever had to deal with a conflict in your team? How did you handle it?",
+    "I'm curious about how you keep your skills up to date. What do you do to stay current?",
+    "Tell me about a challenging project you worked on recently.",
+    "What aspects of this field are you most passionate about?",
+    "How do you approach learning new technologies or methodologies?",
+    "What's your approach to solving complex problems?",
+    "Can you share an example of how you've handled feedback in the past?"
+)
+
+_MOCK_RESPONSE_TEMPLATES = (
+    "I understand you're asking about {message}... This is a simulated response since we're using a mock API.",
+    "That's an interesting question. In a real implementation, this would connect to the Groq API to generate a response.",
+    "I'm currently running in mock mode. To get real responses, you'll need to implement a proper Groq API client.",
+    "Your question about {short_message}... would normally be processed by the Groq API with the {model} model."
+)
 
 def generate_mock_response(message: str, model: str = DEFAULT_MODEL) -> str:
     """
@@ -160,28 +434,43 @@ def generate_mock_response(message: str, model: str = DEFAULT_MODEL) -> str:
 
     # If the message is asking for a question, return a mock interview question
     if "interview question" in message.lower():
-        questions = [
-            "Can you tell me about a time when you had to work under pressure to meet a deadline?",
-            "When you have multiple deadlines, how do you typically prioritize your work?",
-            "What would you say is your greatest professional achievement so far?",
-            "Have you ever had to deal with a conflict in your team? How did you handle it?",
-            "I'm curious about how you keep your skills up to date. What do you do to stay current?",
-            "Tell me about a challenging project you worked on recently.",
-            "What aspects of this field are you most passionate about?",
-            "How do you approach learning new technologies or methodologies?",
-            "What's your approach to solving complex problems?",
-            "Can you share an example of how you've handled feedback in the past?"
-        ]
-        return random.choice(questions)
+        return _rng().choice(_MOCK_QUESTIONS)
     else:
         # Generic response
-        responses = [
-            f"I understand you're asking about {message[:30]}... This is a simulated response since we're using a mock API.",
-            "That's an interesting question. In a real implementation, this would connect to the Groq API to generate a response.",
-            "I'm currently running in mock mode. To get real responses, you'll need to implement a proper Groq API client.",
-            f"Your question about {message[:20]}... would normally be processed by the Groq API with the {model} model."
-        ]
-        return random.choice(responses)
+        return _rng().choice(_MOCK_RESPONSE_TEMPLATES).format(
+            message=message[:30], short_message=message[:20], model=model
+        )
+
+def question_cache_key(
+    job_role: str,
+    previous_questions: List[str] = None,
+    previous_answers: List[str] = None,
+    cv_data: Dict[str, Any] = None,
+    model: str = DEFAULT_MODEL,
+    is_new_session: bool = False,
+    session_id: str = None
+) -> Optional[bytes]:
+    """
+    Build the response cache key for a question request
+
+    The key covers the session, job role, CV and the full question and answer
+    history, so only a repeat of the same step in the same session (a retry or
+    a double submit) is served from cache. The per-request unique_id is left
+    out on purpose: callers generate a fresh one every time. Opening questions
+    and requests without a session are never cached.
+
+    Returns:
+        The cache key, or None if the response should not be cached
+    """
+    question_count = len(previous_questions) if previous_questions else 0
+    if is_new_session or question_count == 0 or not session_id:
+        return None
+
+    cv_hash = _hash_text(json.dumps(cv_data, sort_keys=True, default=str)).hex() if cv_data else ""
+    history_hash = _hash_text(json.dumps([previous_questions, previous_answers or []])).hex()
+    return _hash_text("\x1f".join([
+        model, session_id, job_role or "", cv_hash, history_hash
+    ]))
 
 def generate_interview_question(
     job_role: str,
@@ -190,7 +479,8 @@ def generate_interview_question(
     cv_data: Dict[str, Any] = None,
     model: str = DEFAULT_MODEL,
     is_new_session: bool = False,
-    unique_id: str = None
+    unique_id: str = None,
+    session_id: str = None
 ) -> str:
     """
     Generate an interview question based on context and research-based sequencing
@@ -203,121 +493,123 @@ def generate_interview_question(
         model: The model to use
         is_new_session: Whether this is a new session or continuing one
         unique_id: Unique identifier to prevent duplicate questions
+        session_id: Interview session the question belongs to; questions are
+            only cached within a session
 
     Returns:
         Generated interview question
     """
-    # Initialize previous questions and answers if None
-    if previous_questions is None:
-        previous_questions = []
-    if previous_answers is None:
-        previous_answers = []
+    # The mock ignores the prompt, so don't spend time building it
+    if _USE_MOCK:
+        return generate_mock_response("interview question", model)
 
-    # Determine the current interview stage based on the number of questions
-    question_count = len(previous_questions)
+    system_prompt, prompt = build_question_prompt(
+        job_role, previous_questions, previous_answers, cv_data, is_new_session, unique_id
+    )
 
-    # Define interview stages
-    if question_count == 0:
-        stage = "initial"
-    elif question_count < 3:
-        stage = "early"
-    elif question_count < 7:
-        stage = "middle"
-    elif question_count < 12:
-        stage = "late"
-    else:
-        stage = "closing"
+    # Send the prompt to the API
+    cache_key = question_cache_key(
+        job_role, previous_questions, previous_answers, cv_data, model, is_new_session,
+        session_id
+    )
+    response = send_message(
+        prompt, model, system=system_prompt,
+        cache_key=cache_key, stop_on_question=True
+    )
 
-    # Force initial stage if this is explicitly a new session, regardless of question count
-    if is_new_session:
-        stage = "initial"
-        logger.info(f"Forcing initial stage because is_new_session=True")
+    return clean_question_response(response)
 
-    # Double-check: if this is the first question (no previous questions), always use initial stage
-    if len(previous_questions) == 0:
-        stage = "initial"
-        logger.info(f"Forcing initial stage because this is the first question (no previous questions)")
+async def generate_interview_question_async(
+    job_role: str,
+    previous_questions: List[str] = None,
+    previous_answers: List[str] = None,
+    cv_data: Dict[str, Any] = None,
+    model: str = DEFAULT_MODEL,
+    is_new_session: bool = False,
+    unique_id: str = None,
+    session_id: str = None,
+    client=None
+) -> str:
+    """
+    Generate an interview question without blocking the event loop
 
-    logger.info(f"Current interview stage: {stage} (question count: {question_count}, is_new_session: {is_new_session})")
+    Takes the same arguments as generate_interview_question, plus an optional
+    AsyncOpenAI client to send the request with.
 
-    # Construct a prompt for the model
-    prompt = f"""You are an expert AI job interview coach conducting a natural, conversational interview. Generate ONE interview question that sounds like it's coming from a human interviewer.
+    Returns:
+        Generated interview question
+    """
+    # The mock ignores the prompt, so don't spend time building it
+    if _USE_MOCK:
+        return generate_mock_response("interview question", model)
 
-"""
+    system_prompt, prompt = build_question_prompt(
+        job_role, previous_questions, previous_answers, cv_data, is_new_session, unique_id
+    )
+    cache_key = question_cache_key(
+        job_role, previous_questions, previous_answers, cv_data, model, is_new_session,
+        session_id
+    )
+    response = await send_message_async(
+        prompt, model, system=system_prompt,
+        cache_key=cache_key, stop_on_question=True, client=client
+    )
+    return clean_question_response(response)
 
-    # Add CV data if available for personalization
-    if cv_data:
-        # Extract relevant information from CV data without dumping the entire JSON
-        skills = cv_data.get('skills', [])
-        experience = cv_data.get('experience', [])
-        education = cv_data.get('education', [])
-        target_job = cv_data.get('target_job', job_role)
-        projects = cv_data.get('projects', [])
-        achievements = cv_data.get('achievements', [])
-        
-        # Format skills as a comma-separated list
-        skills_str = ', '.join(skills[:7]) if skills else 'Not specified'
-        
-        # Format experience more readably
-        if isinstance(experience, list):
-            exp_str = "\n".join([f"- {exp}" for exp in experience[:3]])
-        else:
-            exp_str = str(experience)[:300]
-            
-        # Format education more readably
-        if isinstance(education, list):
-            edu_str = "\n".join([f"- {edu}" for edu in education[:2]])
-        else:
-            edu_str = str(education)[:200]
-            
-        # Format projects if available
-        if projects and isinstance(projects, list):
-            proj_str = "\n".join([f"- {proj}" for proj in projects[:2]])
-        else:
-            proj_str = str(projects)[:200] if projects else "Not specified"
+# Upper bound on in-flight Groq requests for one batch
+BATCH_MAX_CONCURRENCY = 16
 
-        # Use the target job from CV if available, otherwise use the provided job_role
-        actual_job_role = target_job if target_job else job_role
+async def generate_interview_questions_batch_async(
+    specs: List[Dict[str, Any]],
+    max_concurrency: int = BATCH_MAX_CONCURRENCY
+) -> List[str]:
+    """
+    Generate interview questions for several sessions concurrently
 
-        prompt += f"""
-The candidate is interviewing for a {actual_job_role} position.
+    Args:
+        specs: One dict of generate_interview_question keyword arguments per question
+        max_concurrency: Maximum number of Groq requests in flight at once
 
-Detailed CV information:
-- Target Position: {actual_job_role}
-- Skills: {skills_str}
-- Experience: 
-{exp_str}
-- Education: 
-{edu_str}
-- Projects: 
-{proj_str}
-- Achievements: {str(achievements)[:200] if achievements else 'Not specified'}
+    Returns:
+        Generated interview questions, in the same order as specs
+    """
+    # One pooled client for the whole batch, closed before returning so its
+    # connections never outlive the batch (or the event loop it ran on)
+    client = None if _USE_MOCK else _new_async_client()
+    sem = asyncio.Semaphore(max_concurrency)
 
-IMPORTANT: After the initial introductory question, you should use this CV information to personalize your questions. Refer to specific elements from their CV in your questions, but do so naturally without explicitly mentioning "from your CV" or "I see in your CV". 
+    async def _one(spec):
+        async with sem:
+            return await generate_interview_question_async(**spec, client=client)
 
-For example, instead of saying "I see from your CV that you have experience with Python", say "Could you tell me about a challenging project where you applied your Python skills?"
+    try:
+        return list(await asyncio.gather(*(_one(spec) for spec in specs)))
+    finally:
+        if client is not None:
+            await client.close()
+
+def generate_interview_questions_batch(
+    specs: List[Dict[str, Any]],
+    max_concurrency: int = BATCH_MAX_CONCURRENCY
+) -> List[str]:
+    """
+    Generate interview questions for several sessions concurrently
 
-Frame the question naturally as a human interviewer would, incorporating their background information subtly into your questions.
-"""
-    else:
-        # If no CV data, still use the job role if provided
-        if job_role:
-            prompt += f"""
-The candidate is interviewing for a {job_role} position.
+    Starts its own event loop, so it can't be called from a coroutine; await
+    generate_interview_questions_batch_async there instead.
 
-Please ask a natural question that a human interviewer would ask. Do NOT mention the specific position in the question itself or state that this is a personalized question.
-"""
+    Args:
+        specs: One dict of generate_interview_question keyword arguments per question
+        max_concurrency: Maximum number of Groq requests in flight at once
 
-    # Add a unique identifier for this specific question to ensure variety
-    question_unique_id = f"{unique_id}-{random.randint(1, 10000)}"
-    prompt += f"\nUnique question identifier: {question_unique_id}\n"
+    Returns:
+        Generated interview questions, in the same order as specs
+    """
+    return asyncio.run(generate_interview_questions_batch_async(specs, max_concurrency))
 
-    # Add stage-specific instructions
-    if stage == "initial":
-        # Initial stage - safe first questions
-        if is_new_session:
-            if cv_data:
-                prompt += f"""
+# Stage-specific prompt templates, parsed once at import and selected by stage key.
+# $question_number is the 1-based question number.
+_INITIAL_CV_TMPL = string.Template("""
 This is the start of a new interview session. Ask a natural, conversational opening question that helps establish rapport and sets the tone for the interview. Make it sound like a human interviewer starting a conversation, not an AI.
 
 IMPORTANT CONTEXT TO FOLLOW:
@@ -331,8 +623,6 @@ Since you have the candidate's CV data, DO NOT immediately jump to technical que
 
 IMPORTANT: Be creative and varied in your questions. Do not use the same template or structure as previous questions. Create a unique, personalized question that hasn't been asked before.
 
-To ensure variety, use this random seed value to guide your creativity: {random.randint(1, 10000)}
-
 Here are some appropriate approaches for the FIRST question (but don't limit yourself to these):
 - Ask about their professional journey and what led them to this field
 - Ask about what aspects of their work they find most rewarding or challenging
@@ -343,9 +633,9 @@ Here are some appropriate approaches for the FIRST question (but don't limit you
 DO NOT ask technical questions in the first interaction, even if you have CV data. Technical questions should come later in the interview sequence.
 
 IMPORTANT: Return ONLY the question itself. DO NOT include phrases like "Here's a conversational opening question" or "This question helps establish rapport". Just give the actual question a human interviewer would ask.
-"""
-            else:
-                prompt += f"""
+""")
+
+_INITIAL_NOCV_TMPL = string.Template("""
 This is the start of a new interview session. You are a professional interviewer. Begin with a warm, professional introduction and a natural opening question.
 
 Your first question should:
@@ -357,8 +647,6 @@ Your first question should:
 
 IMPORTANT: Be creative and varied in your questions. Do not use the same template or structure as previous questions. Create a unique, engaging question that hasn't been asked before.
 
-To ensure variety, use this random seed value to guide your creativity: {random.randint(1, 10000)}
-
 Here are some diverse approaches for opening questions (but don't limit yourself to these):
 - Ask about their professional journey and what led them to this field
 - Ask about what aspects of their work they find most rewarding or challenging
@@ -372,11 +660,10 @@ Here are some diverse approaches for opening questions (but don't limit yourself
 - Ask about a professional achievement they're particularly proud of
 
 IMPORTANT: Return ONLY the question itself. DO NOT include phrases like "Here's a conversational opening question" or "This question helps establish rapport". Just give the actual question a human interviewer would ask.
-"""
-    elif stage == "early":
-        # Early stage - build rapport and gather background
-        prompt += f"""
-You are in the EARLY stage of the interview (question {question_count+1} of approximately 15).
+""")
+
+_EARLY_TMPL = string.Template("""
+You are in the EARLY stage of the interview (question $question_number of approximately 15).
 
 IMPORTANT CONTEXT TO FOLLOW:
 1. Questions should follow a logical sequence based on previous answers
@@ -392,8 +679,6 @@ At this stage, focus on:
 
 IMPORTANT: Be creative and varied in your questions. Do not use the same template or structure as previous questions. Create a unique question that hasn't been asked before.
 
-To ensure variety, use this random seed value to guide your creativity: {random.randint(1, 10000)}
-
 Here are some diverse approaches for early-stage questions (but don't limit yourself to these):
 - Ask about a specific skill or experience mentioned in their CV
 - Ask about their professional philosophy or work ethic
@@ -408,11 +693,10 @@ Here are some diverse approaches for early-stage questions (but don't limit your
 - Ask about their experience with diverse teams or inclusive workplaces
 
 Your question should flow naturally from their previous answers while moving the interview forward. If CV data is available, subtly incorporate elements from their CV into your questions without explicitly mentioning "from your CV" or "I see in your CV".
-"""
-    elif stage == "middle":
-        # Middle stage - behavioral and situational questions
-        prompt += f"""
-You are in the MIDDLE stage of the interview (question {question_count+1} of approximately 15).
+""")
+
+_MIDDLE_TMPL = string.Template("""
+You are in the MIDDLE stage of the interview (question $question_number of approximately 15).
 
 IMPORTANT CONTEXT TO FOLLOW:
 1. Questions should follow a logical sequence based on previous answers
@@ -428,8 +712,6 @@ At this stage, focus on:
 
 IMPORTANT: Be creative and varied in your questions. Do not use the same template or structure as previous questions. Create a unique, challenging question that hasn't been asked before.
 
-To ensure variety, use this random seed value to guide your creativity: {random.randint(1, 10000)}
-
 Here are some diverse approaches for middle-stage behavioral questions (but don't limit yourself to these):
 - Ask about a time they had to resolve a conflict within a team
 - Ask about a situation where they had to adapt to unexpected changes
@@ -443,11 +725,10 @@ Here are some diverse approaches for middle-stage behavioral questions (but don'
 - Ask about a time they had to persuade others to adopt their idea or approach
 
 Your question should be more specific and challenging than earlier questions, while still flowing naturally from the conversation. If you're introducing technical questions, do so gradually and based on their previous responses.
-"""
-    elif stage == "late":
-        # Late stage - technical and role-specific questions
-        prompt += f"""
-You are in the LATE stage of the interview (question {question_count+1} of approximately 15).
+""")
+
+_LATE_TMPL = string.Template("""
+You are in the LATE stage of the interview (question $question_number of approximately 15).
 
 IMPORTANT CONTEXT TO FOLLOW:
 1. Questions should follow a logical sequence based on previous answers
@@ -463,8 +744,6 @@ At this stage, focus on:
 
 IMPORTANT: Be creative and varied in your questions. Do not use the same template or structure as previous questions. Create a unique, challenging question that hasn't been asked before.
 
-To ensure variety, use this random seed value to guide your creativity: {random.randint(1, 10000)}
-
 Here are some diverse approaches for late-stage questions (but don't limit yourself to these):
 - Ask about their approach to a specific challenge relevant to the role
 - Ask about how they would implement a particular solution or strategy
@@ -478,11 +757,10 @@ Here are some diverse approaches for late-stage questions (but don't limit yours
 - Ask about how they balance quality with business constraints
 
 Your question should assess deeper competencies while building on information already shared. Make sure your questions are appropriate to the candidate's background and experience level as revealed in their previous answers.
-"""
-    else:
-        # Closing stage - final assessment and wrap-up
-        prompt += f"""
-You are in the CLOSING stage of the interview (question {question_count+1} of approximately 15).
+""")
+
+_CLOSING_TMPL = string.Template("""
+You are in the CLOSING stage of the interview (question $question_number of approximately 15).
 
 At this stage, focus on:
 1. Final assessment questions
@@ -492,8 +770,6 @@ At this stage, focus on:
 
 IMPORTANT: Be creative and varied in your questions. Do not use the same template or structure as previous questions. Create a unique, thoughtful closing question that hasn't been asked before.
 
-To ensure variety, use this random seed value to guide your creativity: {random.randint(1, 10000)}
-
 Here are some diverse approaches for closing-stage questions (but don't limit yourself to these):
 - Ask about their long-term career aspirations or goals
 - Ask about what they're looking for in their next role or company culture
@@ -507,25 +783,197 @@ Here are some diverse approaches for closing-stage questions (but don't limit yo
 - Ask about what they would like to add that hasn't been covered in the interview
 
 If this is likely to be the final question (question 14 or 15), consider a wrap-up question that gives the candidate a chance to leave a strong final impression.
+""")
+
+# Interview stage by number of questions already asked; counts past the end are "closing"
+_STAGE_BY_COUNT = (
+    ("initial",)
+    + ("early",) * 2      # questions 2-3
+    + ("middle",) * 4     # questions 4-7
+    + ("late",) * 5       # questions 8-12
+    + ("closing",)        # question 13 onwards
+)
+
+_STAGE_TEMPLATES = {
+    "initial_cv": _INITIAL_CV_TMPL,
+    "initial_nocv": _INITIAL_NOCV_TMPL,
+    "early": _EARLY_TMPL,
+    "middle": _MIDDLE_TMPL,
+    "late": _LATE_TMPL,
+    "closing": _CLOSING_TMPL
+}
+
+_QUESTION_GUIDELINES = """
+Guidelines for the question:
+1. Make it sound natural and conversational, as if a human interviewer is asking it
+2. Ensure it's different from any previous questions
+3. Focus on behavioral or situational aspects when appropriate
+4. Keep it concise and clear
+5. Make it open-ended to encourage detailed responses
+6. Avoid yes/no questions
+7. CRITICAL: Return ONLY the question itself with NO explanations, meta-commentary, or additional text
+8. DO NOT include phrases like "Here's a question" or "Here's the opening question" or "This is a conversational opening question"
+9. DO NOT include any prefixes like "Question:" or "Interview Question:"
+10. DO NOT start with "I would like to ask" or "Let me ask you" or "For my first question"
+11. Keep your question concise and focused - aim for 1-2 sentences maximum
+12. NEVER mention that this is a "personalized question" or refer to the specific job position in the question itself
+13. Use natural language that a human interviewer would use (e.g., "Can you tell me about..." instead of "Describe a situation where...")
+14. Avoid overly formal or robotic phrasing
+15. DO NOT include phrases like "to establish rapport" or "to set the tone" - just ask the question directly
+16. JUST GIVE THE QUESTION ITSELF, nothing more - as if you are the interviewer speaking directly to the candidate
+17. WRONG: "Here's the opening question: What's been your experience with..."
+18. RIGHT: "What's been your experience with..."
 """
 
+def _bullet(items: Any, n: int, max_chars: int) -> str:
+    """Format the first n items of a CV list as bullets, or truncate a free-text value"""
+    if isinstance(items, list):
+        return "\n".join(f"- {item}" for item in islice(items, n))
+    return str(items)[:max_chars]
+
+# Topics in the last answer that get an adaptive follow-up hint; word stems match
+# inflected forms ("achievements", "collaborated")
+_ADAPTIVE_RE = re.compile(
+    r"\b(?:(?P<achieve>achiev|success|accomplish|proud|impact)"
+    r"|(?P<challenge>challeng|difficult|problem|obstacle|struggl)"
+    r"|(?P<team>team|colleague|collaborat|group|work together))",
+    re.IGNORECASE
+)
+
+def build_question_prompt(
+    job_role: str,
+    previous_questions: List[str] = None,
+    previous_answers: List[str] = None,
+    cv_data: Dict[str, Any] = None,
+    is_new_session: bool = False,
+    unique_id: str = None
+) -> Tuple[str, str]:
+    """
+    Build the question-generation prompt based on context and research-based sequencing
+
+    Args:
+        job_role: The job role being interviewed for
+        previous_questions: Array of previous questions asked
+        previous_answers: Array of previous answers given
+        cv_data: Optional CV data for personalization
+        is_new_session: Whether this is a new session or continuing one
+        unique_id: Unique identifier to prevent duplicate questions
+
+    Returns:
+        A (system_prompt, user_prompt) tuple. The system prompt holds everything
+        that stays fixed across a session (instructions, CV, guidelines) so the
+        provider can cache it as a prefix; all per-request values go in the user prompt.
+    """
+    # Initialize previous questions and answers if None
+    if previous_questions is None:
+        previous_questions = []
+    if previous_answers is None:
+        previous_answers = []
+
+    # Determine the current interview stage based on the number of questions
+    question_count = len(previous_questions)
+
+    # Define interview stages; a new session always restarts at the initial stage
+    if is_new_session or question_count == 0:
+        stage = "initial"
+    else:
+        stage = _STAGE_BY_COUNT[min(question_count, len(_STAGE_BY_COUNT) - 1)]
+
+    logger.info(f"Current interview stage: {stage} (question count: {question_count}, is_new_session: {is_new_session})")
+
+    # Construct a prompt for the model
+    parts = [f"""You are an expert AI job interview coach conducting a natural, conversational interview. Generate ONE interview question that sounds like it's coming from a human interviewer.
+
+"""]
+
+    # Add CV data if available for personalization
+    if cv_data:
+        # Extract relevant information from CV data without dumping the entire JSON
+        skills = cv_data.get('skills', [])
+        experience = cv_data.get('experience', [])
+        education = cv_data.get('education', [])
+        target_job = cv_data.get('target_job', job_role)
+        projects = cv_data.get('projects', [])
+        achievements = cv_data.get('achievements', [])
+        
+        # Format skills as a comma-separated list
+        skills_str = ', '.join(skills[:7]) if skills else 'Not specified'
+        
+        # Format experience, education and projects as short bullet lists
+        exp_str = _bullet(experience, 3, 300)
+        edu_str = _bullet(education, 2, 200)
+        proj_str = _bullet(projects, 2, 200) if projects else "Not specified"
+
+        # Use the target job from CV if available, otherwise use the provided job_role
+        actual_job_role = target_job if target_job else job_role
+
+        parts.append(f"""
+The candidate is interviewing for a {actual_job_role} position.
+
+Detailed CV information:
+- Target Position: {actual_job_role}
+- Skills: {skills_str}
+- Experience: 
+{exp_str}
+- Education: 
+{edu_str}
+- Projects: 
+{proj_str}
+- Achievements: {str(achievements)[:200] if achievements else 'Not specified'}
+
+IMPORTANT: After the initial introductory question, you should use this CV information to personalize your questions. Refer to specific elements from their CV in your questions, but do so naturally without explicitly mentioning "from your CV" or "I see in your CV". 
+
+For example, instead of saying "I see from your CV that you have experience with Python", say "Could you tell me about a challenging project where you applied your Python skills?"
+
+Frame the question naturally as a human interviewer would, incorporating their background information subtly into your questions.
+""")
+    else:
+        # If no CV data, still use the job role if provided
+        if job_role:
+            parts.append(f"""
+The candidate is interviewing for a {job_role} position.
+
+Please ask a natural question that a human interviewer would ask. Do NOT mention the specific position in the question itself or state that this is a personalized question.
+""")
+
+    # Add guidelines for question generation
+    parts.append(_QUESTION_GUIDELINES)
+    system_prompt = "".join(parts)
+
+    # Everything below changes from request to request, so it goes after the
+    # cacheable system prompt
+    parts = []
+
+    # Add stage-specific instructions
+    # The initial stage only gets instructions when this is explicitly a new session
+    if stage == "initial":
+        key = ("initial_cv" if cv_data else "initial_nocv") if is_new_session else None
+    else:
+        key = stage
+    if key:
+        parts.append(_STAGE_TEMPLATES[key].substitute(question_number=question_count + 1))
+
+    # Add a unique identifier for this specific question to ensure variety
+    question_unique_id = f"{unique_id}-{_rng().randint(1, 10000)}"
+    parts.append(f"\nUnique question identifier: {question_unique_id}\n")
+    if key:
+        parts.append(f"To ensure variety, use this random seed value to guide your creativity: {_rng().randint(1, 10000)}\n")
+
     # Add previous questions and answers for context and adaptive questioning
     if previous_questions and previous_answers:
         # Limit to the last 3 exchanges to keep context manageable
         context_limit = min(3, len(previous_questions), len(previous_answers))
+        recent_questions = previous_questions[-context_limit:]
+        recent_answers = previous_answers[-context_limit:]
 
-        prompt += "\nHere are the most recent questions and answers:\n"
+        parts.append("\nHere are the most recent questions and answers:\n")
 
-        for i in range(context_limit):
-            q_idx = len(previous_questions) - context_limit + i
-            a_idx = len(previous_answers) - context_limit + i
-
-            if q_idx >= 0 and a_idx >= 0:
-                prompt += f"Q: {previous_questions[q_idx]}\n"
-                prompt += f"A: {previous_answers[a_idx]}\n\n"
+        for q, a in zip(recent_questions, recent_answers):
+            parts.append(f"Q: {q}\n")
+            parts.append(f"A: {a}\n\n")
 
         # Add adaptive questioning instructions
-        prompt += """
+        parts.append("""
 Based on this context, ask a natural follow-up question that:
 1. Flows conversationally from their previous answer
 2. Explores interesting points they mentioned that deserve further discussion
@@ -534,205 +982,202 @@ Based on this context, ask a natural follow-up question that:
 5. Sounds like a human interviewer continuing a conversation, not an AI following a script
 
 If their previous answer was incomplete or vague, consider asking a follow-up question that helps them provide more specific details or examples.
-"""
+""")
 
         # Add specific adaptive logic based on the last answer
-        if len(previous_answers) > 0:
-            last_answer = previous_answers[-1].lower()
+        if recent_answers:
+            last_answer = recent_answers[-1]
+            word_count = len(last_answer.split())
+
+            # One pass over the answer to find which topics it mentions
+            hits = {m.lastgroup for m in _ADAPTIVE_RE.finditer(last_answer)}
 
             # Check if the answer mentioned specific achievements
-            if any(term in last_answer for term in ["achieve", "success", "accomplish", "proud", "impact"]):
-                prompt += "\nTheir answer mentioned achievements or successes. Consider asking for specific metrics, outcomes, or what they learned from the experience.\n"
+            if "achieve" in hits:
+                parts.append("\nTheir answer mentioned achievements or successes. Consider asking for specific metrics, outcomes, or what they learned from the experience.\n")
 
             # Check if the answer mentioned challenges
-            if any(term in last_answer for term in ["challenge", "difficult", "problem", "obstacle", "struggle"]):
-                prompt += "\nTheir answer mentioned challenges or problems. Consider asking how they overcame these challenges or what they learned from the experience.\n"
+            if "challenge" in hits:
+                parts.append("\nTheir answer mentioned challenges or problems. Consider asking how they overcame these challenges or what they learned from the experience.\n")
 
             # Check if the answer mentioned teamwork
-            if any(term in last_answer for term in ["team", "colleague", "collaborate", "group", "work together"]):
-                prompt += "\nTheir answer mentioned teamwork or collaboration. Consider asking about their specific role in the team or how they handle team conflicts.\n"
+            if "team" in hits:
+                parts.append("\nTheir answer mentioned teamwork or collaboration. Consider asking about their specific role in the team or how they handle team conflicts.\n")
 
             # Check if the answer was very brief
-            if len(last_answer.split()) < 30:
-                prompt += "\nTheir previous answer was quite brief. Ask a question that encourages them to elaborate and provide more details.\n"
-
-    # Add guidelines for question generation
-    prompt += """
-Guidelines for the question:
-1. Make it sound natural and conversational, as if a human interviewer is asking it
-2. Ensure it's different from any previous questions
-3. Focus on behavioral or situational aspects when appropriate
-4. Keep it concise and clear
-5. Make it open-ended to encourage detailed responses
-6. Avoid yes/no questions
-7. CRITICAL: Return ONLY the question itself with NO explanations, meta-commentary, or additional text
-8. DO NOT include phrases like "Here's a question" or "Here's the opening question" or "This is a conversational opening question"
-9. DO NOT include any prefixes like "Question:" or "Interview Question:"
-10. DO NOT start with "I would like to ask" or "Let me ask you" or "For my first question"
-11. Keep your question concise and focused - aim for 1-2 sentences maximum
-12. NEVER mention that this is a "personalized question" or refer to the specific job position in the question itself
-13. Use natural language that a human interviewer would use (e.g., "Can you tell me about..." instead of "Describe a situation where...")
-14. Avoid overly formal or robotic phrasing
-15. DO NOT include phrases like "to establish rapport" or "to set the tone" - just ask the question directly
-16. JUST GIVE THE QUESTION ITSELF, nothing more - as if you are the interviewer speaking directly to the candidate
-17. WRONG: "Here's the opening question: What's been your experience with..."
-18. RIGHT: "What's been your experience with..."
-"""
+            if word_count < 30:
+                parts.append("\nTheir previous answer was quite brief. Ask a question that encourages them to elaborate and provide more details.\n")
+
+    parts.append("\nNow ask the next interview question.\n")
+
+    return system_prompt, "".join(parts)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Leading labels and "Here's a ..." style lead-ins stripped from generated questions.
+# A lead-in runs up to its colon; without one, it is a whole lead-in sentence
+# ("Here's a question that comes up a lot. ..."), or else runs up to "that"/"which"
+# ("Here's a question that tests ...")
+_LEAD_IN = r"^(?:here(?:'s|\s+is)|this\s+is)\s+(?:a|an|the|my)\b"
+_PREFIX_RE = re.compile(
+    r"^(?:(?:interview|opening|first)\s+)?question\s*:\s*"
+    r"|^q\s*:\s*"
+    rf"|{_LEAD_IN}[^:]*:\s*"
+    rf"|{_LEAD_IN}[^:.!?]*[.!]\s+(?=\S)"
+    rf"|{_LEAD_IN}[^:]*?\b(?:that|which)\b\s*",
+    re.IGNORECASE
+)
+
+# Meta-commentary phrases that can appear inside an otherwise good question,
+# in the order clean_question_response tries them
+_META_PHRASES = (
+    "as a first question",
+    "to start our interview",
+    "to begin our conversation",
+    "to get started",
+    "to kick things off",
+    "to begin with",
+    "to start with",
+    "to establish rapport",
+    "to set the tone",
+    "as an opening question",
+    "here's a conversational",
+    "here's a natural",
+    "here's the opening",
+    "here is the opening",
+    "here's my first",
+    "here is my first",
+    "for my first question",
+    "for the first question",
+    "this is a question",
+    "this question helps",
+    "this question is designed",
+    "this question aims",
+    "this question will help",
+    "this question allows",
+    "this question gives",
+    "this question focuses",
+    "this question explores",
+    "i would like to ask",
+    "i'd like to ask",
+    "i would ask",
+    "i'd ask",
+    "let me ask",
+    "let's start with"
+)
+# One alternation over every phrase, used to probe for any of them in a single scan
+_META_PHRASE_RE = re.compile(
+    "|".join(re.escape(p) for p in sorted(_META_PHRASES, key=len, reverse=True))
+)
+
+# Whole-response meta-commentary wrappers around the actual question:
+# "Here's a [adjective] question:", "I would (like to) ask:" and "A good question would be:"
+_LEAD_PATTERNS_RE = re.compile(
+    r"^(?:here'?s\s+an?\s+\w+\s+question"
+    r"|i\s+would\s+(?:like\s+to\s+)?ask"
+    r"|a\s+\w+\s+question\s+would\s+be)"
+    r":?\s+(.+)$",
+    re.IGNORECASE
+)
+
+# Lead-ins ending in ":" or "," before the question; group 2 is the question
+_META_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r"^(here'?s\s+(?:a|an|the|my)\s+(?:question|inquiry)\s+(?:about|regarding|on|for|to)\s+.+?:\s*)(.*)",
+    r"^(i'?(?:d|would)\s+like\s+to\s+(?:ask|know|inquire)\s+(?:about|regarding|on|for|to)\s+.+?:\s*)(.*)",
+    r"^(let'?s\s+(?:talk|discuss|start)\s+(?:about|with|by)\s+.+?:\s*)(.*)",
+    r"^(for\s+(?:my|the|this|our)\s+(?:first|next|opening|initial)\s+(?:question|inquiry),\s*)(.*)",
+    r"^(to\s+(?:begin|start|open)\s+(?:with|our|the)\s+(?:interview|conversation|discussion),\s*)(.*)"
+]]
+
+# Cheap probe for any of the meta-commentary above: an embedded phrase, or one of
+# the lead-ins that _LEAD_PATTERNS_RE / _META_PATTERNS anchor at the start.
+# A clean question matches none of them and skips those checks entirely
+_ANY_META_RE = re.compile(
+    _META_PHRASE_RE.pattern
+    + r"|^(?:here|i'?d\s|i\s+would|let'?s\s|for\s+(?:my|the|this|our)\s|to\s+(?:begin|start|open)\s"
+    + r"|a\s+\w+\s+question\s+would\s+be)",
+    re.IGNORECASE
+)
+
+def _capitalize_first(text: str) -> str:
+    """Uppercase the first character, leaving the rest of the text as is"""
+    if text and not text[0].isupper():
+        return text[0].upper() + text[1:]
+    return text
+
+def clean_question_response(response: str) -> str:
+    """
+    Strip formatting and meta-commentary from a generated question
 
-    # Send the prompt to the API
-    response = send_message(prompt, model)
+    Args:
+        response: The raw model response
 
+    Returns:
+        The cleaned question
+    """
     # Clean up the response - remove any unwanted text and formatting
-    # Split by newlines and remove empty lines
-    lines = [line.strip() for line in response.split('\n') if line.strip()]
-
-    # If we have multiple lines, join them with spaces
-    if len(lines) > 1:
-        # Join all lines with spaces
-        cleaned_response = ' '.join(lines)
-        logger.info(f"Joined multiple lines. Original had {len(lines)} lines.")
-    else:
-        cleaned_response = response.strip()
-
-    # Remove any prefixes like "Question:" or "Interview Question:"
-    prefixes = [
-        "question:", "interview question:", "q:",
-        "here's a", "here is a", "here's an", "here is an",
-        "this is a", "this is an",
-        "here's a conversational opening question",
-        "here's a natural", "here is a natural",
-        "here's a warm", "here is a warm",
-        "here's the opening question:", "here is the opening question:",
-        "opening question:", "first question:"
-    ]
-
-    for prefix in prefixes:
-        if cleaned_response.lower().startswith(prefix):
-            # Find the first occurrence of "that" or "which" after the prefix, which often indicates
-            # the start of the actual question content
-            lower_response = cleaned_response.lower()
-            prefix_end = len(prefix)
-
-            # Look for transition words that often appear between the meta-commentary and the actual question
-            transition_indices = []
-            for word in ["that", "which", ":"]:
-                idx = lower_response.find(word, prefix_end)
-                if idx > -1:
-                    transition_indices.append(idx + len(word))
-
-            # If we found any transition words, use the earliest one
-            if transition_indices:
-                earliest_transition = min(transition_indices)
-                cleaned_response = cleaned_response[earliest_transition:].strip()
-                logger.info(f"Removed prefix and meta-commentary: '{cleaned_response[:earliest_transition]}'")
-            else:
-                # If no transition words found, just remove the prefix
-                cleaned_response = cleaned_response[len(prefix):].strip()
-                logger.info(f"Removed prefix: '{prefix}'")
+    # Collapse newlines and runs of whitespace into single spaces
+    cleaned_response = _WHITESPACE_RE.sub(' ', response).strip()
+
+    # Remove any prefixes like "Question:" or "Interview Question:", or lead-ins
+    # like "Here's a natural opening question:" or "Here's a question that ..."
+    cleaned_response, removed = _PREFIX_RE.subn('', cleaned_response, count=1)
+    if removed:
+        logger.info("Removed question prefix")
 
     # Remove any leading punctuation that might remain after prefix removal
     cleaned_response = cleaned_response.lstrip(",:;-– ")
 
-    # Capitalize the first letter if it's not already capitalized
-    if cleaned_response and not cleaned_response[0].isupper():
-        cleaned_response = cleaned_response[0].upper() + cleaned_response[1:]
-
     # Remove duplicated questions (sometimes the model repeats the question)
     cleaned_response = remove_duplicated_questions(cleaned_response)
 
-    # Additional check for meta-commentary phrases embedded in the question
-    meta_phrases = [
-        "as a first question",
-        "to start our interview",
-        "to begin our conversation",
-        "to get started",
-        "to kick things off",
-        "to begin with",
-        "to start with",
-        "to establish rapport",
-        "to set the tone",
-        "as an opening question",
-        "here's a conversational",
-        "here's a natural",
-        "here's the opening",
-        "here is the opening",
-        "here's my first",
-        "here is my first",
-        "for my first question",
-        "for the first question",
-        "this is a question",
-        "this question helps",
-        "this question is designed",
-        "this question aims",
-        "this question will help",
-        "this question allows",
-        "this question gives",
-        "this question focuses",
-        "this question explores",
-        "i would like to ask",
-        "i'd like to ask",
-        "i would ask",
-        "i'd ask",
-        "let me ask",
-        "let's start with"
-    ]
-
-    for phrase in meta_phrases:
-        if phrase in cleaned_response.lower():
-            # Split at the phrase and keep only what comes after
-            parts = cleaned_response.lower().split(phrase)
-            if len(parts) > 1 and len(parts[1].strip()) > 20:  # Ensure we have substantial content after the phrase
-                cleaned_response = parts[1].strip().capitalize()
-                logger.info(f"Removed embedded meta-commentary containing: '{phrase}'")
-                break
+    # Most questions carry no meta-commentary at all
+    if not _ANY_META_RE.search(cleaned_response):
+        return _capitalize_first(cleaned_response)
+
+    # Additional check for meta-commentary phrases embedded in the question.
+    # Phrases are tried in _META_PHRASES order (not by position in the text), and
+    # only the text up to the same phrase's next occurrence is kept. The probe above
+    # already ruled out the common case, so this loop only runs on meta-commentary
+    lower_response = cleaned_response.lower()
+    for phrase in _META_PHRASES:
+        start = lower_response.find(phrase)
+        if start == -1:
+            continue
+        start += len(phrase)
+        end = lower_response.find(phrase, start)
+        rest = lower_response[start:end if end != -1 else None].strip()
+        if len(rest) > 20:  # Ensure we have substantial content after the phrase
+            cleaned_response = rest.capitalize()
+            logger.info(f"Removed embedded meta-commentary containing: '{phrase}'")
+            break
 
     # Final check for common patterns of meta-commentary
-    # Pattern: "Here's a [adjective] question: [actual question]"
-    pattern1 = re.compile(r"^here'?s\s+an?\s+\w+\s+question:?\s+(.+)$", re.IGNORECASE)
-    match = pattern1.match(cleaned_response)
-    if match:
-        cleaned_response = match.group(1).strip()
-        logger.info("Removed 'Here's a [adjective] question:' pattern")
-
-    # Pattern: "I would ask: [actual question]"
-    pattern2 = re.compile(r"^i\s+would\s+(?:like\s+to\s+)?ask:?\s+(.+)$", re.IGNORECASE)
-    match = pattern2.match(cleaned_response)
-    if match:
-        cleaned_response = match.group(1).strip()
-        logger.info("Removed 'I would ask:' pattern")
-
-    # Pattern: "A good question would be: [actual question]"
-    pattern3 = re.compile(r"^a\s+(?:\w+\s+)question\s+would\s+be:?\s+(.+)$", re.IGNORECASE)
-    match = pattern3.match(cleaned_response)
+    # wrapped around the whole question, e.g. "I would ask: [actual question]"
+    match = _LEAD_PATTERNS_RE.match(cleaned_response)
     if match:
         cleaned_response = match.group(1).strip()
-        logger.info("Removed 'A good question would be:' pattern")
+        logger.info("Removed meta-commentary lead-in pattern")
 
-    # Capitalize the first letter again after all processing
-    if cleaned_response and not cleaned_response[0].isupper():
-        cleaned_response = cleaned_response[0].upper() + cleaned_response[1:]
-    
     # Final check for any remaining meta-commentary
     # Look for common patterns like "Here's a question about..." or "I'd like to ask you about..."
-    meta_patterns = [
-        r"^(here'?s\s+(?:a|an|the|my)\s+(?:question|inquiry)\s+(?:about|regarding|on|for|to)\s+.+?:\s*)(.*)",
-        r"^(i'?(?:d|would)\s+like\s+to\s+(?:ask|know|inquire)\s+(?:about|regarding|on|for|to)\s+.+?:\s*)(.*)",
-        r"^(let'?s\s+(?:talk|discuss|start)\s+(?:about|with|by)\s+.+?:\s*)(.*)",
-        r"^(for\s+(?:my|the|this|our)\s+(?:first|next|opening|initial)\s+(?:question|inquiry),\s*)(.*)",
-        r"^(to\s+(?:begin|start|open)\s+(?:with|our|the)\s+(?:interview|conversation|discussion),\s*)(.*)"
-    ]
-    
-    for pattern in meta_patterns:
-        match = re.match(pattern, cleaned_response, re.IGNORECASE)
+    for pattern in _META_PATTERNS:
+        match = pattern.match(cleaned_response)
         if match and match.group(2):
             cleaned_response = match.group(2).strip()
-            # Capitalize first letter if needed
-            if cleaned_response and not cleaned_response[0].isupper():
-                cleaned_response = cleaned_response[0].upper() + cleaned_response[1:]
             logger.info(f"Removed complex meta-commentary using pattern matching")
             break
 
-    return cleaned_response
+    # Capitalize the first letter once, after all processing; every check
+    # above is case-insensitive so it doesn't need to happen earlier
+    return _capitalize_first(cleaned_response)
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+def _normalize_sentence(sentence: str) -> str:
+    """Lowercase a sentence and strip its punctuation for comparison"""
+    return _PUNCT_RE.sub('', sentence.lower())
 
 def remove_duplicated_questions(text: str) -> str:
     """
@@ -745,17 +1190,21 @@ def remove_duplicated_questions(text: str) -> str:
         Cleaned text without duplications
     """
     # Split into sentences
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
 
     if len(sentences) <= 1:
         return text
 
-    # Check for duplicated sentences
+    # Check for duplicated sentences, normalizing each sentence only once
     unique_sentences = []
+    kept = []  # (normalized text, word set) of each kept sentence
     for sentence in sentences:
+        norm = _normalize_sentence(sentence)
+        words = set(norm.split())
         # Skip if this sentence is too similar to any we've already included
-        if not any(similar_sentences(sentence, existing) for existing in unique_sentences):
+        if not any(_similar_normalized(norm, words, kept_norm, kept_words) for kept_norm, kept_words in kept):
             unique_sentences.append(sentence)
+            kept.append((norm, words))
 
     # If we removed any sentences, log it
     if len(unique_sentences) < len(sentences):
@@ -763,6 +1212,20 @@ def remove_duplicated_questions(text: str) -> str:
 
     return ' '.join(unique_sentences)
 
+def _similar_normalized(s1: str, words1: set, s2: str, words2: set) -> bool:
+    """Check if two normalized sentences with precomputed word sets are similar"""
+    # If one is contained in the other, they're similar
+    if s1 in s2 or s2 in s1:
+        return True
+
+    if not words1 or not words2:
+        return False
+
+    overlap = len(words1 & words2) / min(len(words1), len(words2))
+
+    # If more than 70% of words overlap, consider them similar
+    return overlap > 0.7
+
 def similar_sentences(s1: str, s2: str) -> bool:
     """
     Check if two sentences are similar
@@ -775,24 +1238,61 @@ def similar_sentences(s1: str, s2: str) -> bool:
         True if sentences are similar, False otherwise
     """
     # Convert to lowercase and remove punctuation
-    s1 = re.sub(r'[^\w\s]', '', s1.lower())
-    s2 = re.sub(r'[^\w\s]', '', s2.lower())
+    s1 = _normalize_sentence(s1)
+    s2 = _normalize_sentence(s2)
+    return _similar_normalized(s1, set(s1.split()), s2, set(s2.split()))
 
-    # If one is contained in the other, they're similar
-    if s1 in s2 or s2 in s1:
-        return True
+# Fixed tail of the analyze_response prompt, prebuilt for behavioral and other questions
+_STAR_ANALYSIS_INSTRUCTIONS = """
+Analyze the answer using the STAR framework (Situation, Task, Action, Result):
+1. Did they describe the Situation clearly?
+2. Did they explain the Task or challenge they faced?
+3. Did they detail the Actions they took?
+4. Did they share the Results they achieved?
 
-    # Calculate word overlap
-    words1 = set(s1.split())
-    words2 = set(s2.split())
+"""
 
-    if not words1 or not words2:
-        return False
+_ANALYSIS_JSON_STRUCTURE = """
+Provide a detailed analysis in JSON format with the following structure:
+{
+  "completeness": "complete|partial|incomplete",
+  "confidence": "high|medium|low",
+  "strengths": ["strength1", "strength2", ...],
+  "weaknesses": ["weakness1", "weakness2", ...],
+  "improvement_tips": ["tip1", "tip2", ...],
+  "star_rating": 1-5,
+  "key_topics": ["topic1", "topic2", ...],
+  "follow_up_suggestions": ["suggestion1", "suggestion2", ...]
+"""
 
-    overlap = len(words1.intersection(words2)) / min(len(words1), len(words2))
+# STAR components added to the JSON structure for behavioral questions
+_STAR_JSON_STRUCTURE = """,
+  "star_analysis": {
+    "situation": {"present": true|false, "score": 1-5, "feedback": "..."},
+    "task": {"present": true|false, "score": 1-5, "feedback": "..."},
+    "action": {"present": true|false, "score": 1-5, "feedback": "..."},
+    "result": {"present": true|false, "score": 1-5, "feedback": "..."}
+  }
+"""
 
-    # If more than 70% of words overlap, consider them similar
-    return overlap > 0.7
+# Close the JSON structure
+_ANALYSIS_PROMPT_FOOTER = """
+}
+
+Return ONLY the JSON with no additional text.
+"""
+
+_ANALYSIS_PROMPT_TAILS = {
+    True: _STAR_ANALYSIS_INSTRUCTIONS + _ANALYSIS_JSON_STRUCTURE + _STAR_JSON_STRUCTURE + _ANALYSIS_PROMPT_FOOTER,
+    False: _ANALYSIS_JSON_STRUCTURE + _ANALYSIS_PROMPT_FOOTER
+}
+
+# Phrasings that mark a behavioral question, which gets STAR analysis
+_BEHAVIORAL_RE = re.compile(
+    r"tell me about a time|describe a situation|give an example"
+    r"|share an experience|how did you handle|when have you",
+    re.IGNORECASE
+)
 
 def analyze_response(
     question: str,
@@ -821,87 +1321,44 @@ def analyze_response(
         previous_answers = []
 
     # Determine if this is a behavioral question that should use STAR analysis
-    is_behavioral = any(term in question.lower() for term in [
-        "tell me about a time", "describe a situation", "give an example",
-        "share an experience", "how did you handle", "when have you"
-    ])
+    is_behavioral = bool(_BEHAVIORAL_RE.search(question))
 
     # Construct a prompt for the model
-    prompt = f"""You are an expert AI job interview coach. Analyze the following interview question and answer:
+    parts = [f"""You are an expert AI job interview coach. Analyze the following interview question and answer:
 
 Question: {question}
 
 Answer: {answer}
 
-"""
+"""]
 
     # Add context from previous exchanges if available
-    if previous_questions and previous_answers and len(previous_questions) > 0:
+    if previous_questions and previous_answers:
         # Limit to the last 2 exchanges to keep context manageable
         context_limit = min(2, len(previous_questions), len(previous_answers))
 
-        prompt += "\nContext from previous exchanges:\n"
+        parts.append("\nContext from previous exchanges:\n")
 
-        for i in range(context_limit):
-            q_idx = len(previous_questions) - context_limit + i
-            a_idx = len(previous_answers) - context_limit + i
+        parts.append("".join(
+            f"Previous Q: {q}\nPrevious A: {a}\n\n"
+            for q, a in zip(previous_questions[-context_limit:], previous_answers[-context_limit:])
+        ))
 
-            if q_idx >= 0 and a_idx >= 0:
-                prompt += f"Previous Q: {previous_questions[q_idx]}\n"
-                prompt += f"Previous A: {previous_answers[a_idx]}\n\n"
-
-    # Add STAR framework analysis for behavioral questions
-    if is_behavioral:
-        prompt += """
-Analyze the answer using the STAR framework (Situation, Task, Action, Result):
-1. Did they describe the Situation clearly?
-2. Did they explain the Task or challenge they faced?
-3. Did they detail the Actions they took?
-4. Did they share the Results they achieved?
-
-"""
-
-    prompt += """
-Provide a detailed analysis in JSON format with the following structure:
-{
-  "completeness": "complete|partial|incomplete",
-  "confidence": "high|medium|low",
-  "strengths": ["strength1", "strength2", ...],
-  "weaknesses": ["weakness1", "weakness2", ...],
-  "improvement_tips": ["tip1", "tip2", ...],
-  "star_rating": 1-5,
-  "key_topics": ["topic1", "topic2", ...],
-  "follow_up_suggestions": ["suggestion1", "suggestion2", ...]
-"""
-
-    # Add STAR components for behavioral questions
-    if is_behavioral:
-        prompt += """,
-  "star_analysis": {
-    "situation": {"present": true|false, "score": 1-5, "feedback": "..."},
-    "task": {"present": true|false, "score": 1-5, "feedback": "..."},
-    "action": {"present": true|false, "score": 1-5, "feedback": "..."},
-    "result": {"present": true|false, "score": 1-5, "feedback": "..."}
-  }
-"""
-
-    # Close the JSON structure
-    prompt += """
-}
-
-Return ONLY the JSON with no additional text.
-"""
+    # Add the STAR instructions (behavioral questions only), JSON structure and footer
+    parts.append(_ANALYSIS_PROMPT_TAILS[is_behavioral])
+    prompt = "".join(parts)
 
     try:
+        # The analysis comes back as JSON, not prose, so it is parsed as-is;
+        # sentence deduplication only applies to free-text question output
         response = send_message(prompt, model)
-        # Apply deduplication to the response
-        cleaned_response = remove_duplicated_questions(response)
-        if cleaned_response != response:
-            logger.info("Removed duplicated content from analysis response")
-            response = cleaned_response
-
-        # Parse the JSON response
-        analysis = json.loads(response)
+
+        # Parse the JSON response (orjson when available; its decode error
+        # subclasses ValueError so the handler below covers both parsers)
+        if orjson is not None:
+            analysis = orjson.loads(response)
+        else:
+            analysis = json.loads(response)
 
         # Add metadata about the analysis
         analysis["is_behavioral_question"] = is_behavioral
@@ -4,6 +4,7 @@ import tempfile
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
 from werkzeug.security import generate_password_hash
 
 # Add the project root to Python path
@@ -12,9 +13,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.backend import create_app
 from app.backend.db.models import Base, User
 
-@pytest.fixture
-def app(db_session):
-    """Create and configure a new app instance for each test."""
+@pytest.fixture(scope='session')
+def app():
+    """Create and configure one app instance shared by the whole test session."""
     app = create_app({
         'TESTING': True,
         'DATABASE_URL': 'sqlite:///:memory:',
@@ -30,24 +31,21 @@ def app(db_session):
         'SESSION_TYPE': 'filesystem',
         'SESSION_PERMANENT': False
     })
-    
-    # Store db session in app context
-    app.extensions['sqlalchemy'] = {
-        'session': db_session,
-        'engine': db_session.bind
-    }
-    
+
     return app
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def engine():
-    """Create a test database engine."""
+    """Create the test database engine and schema once per test session."""
+    # StaticPool keeps a single in-memory database alive for every connection
     engine = create_engine(
-        'sqlite:///:memory:',
-        connect_args={'check_same_thread': False}
+        'sqlite://',
+        connect_args={'check_same_thread': False},
+        poolclass=StaticPool
     )
     Base.metadata.create_all(engine)
-    return engine
+    yield engine
+    engine.dispose()
 
 @pytest.fixture
 def db_session(engine):
@@ -56,10 +54,9 @@ def db_session(engine):
     transaction = connection.begin()
     session_factory = sessionmaker(bind=connection)
     session = scoped_session(session_factory)
-    
-    # Create tables
-    Base.metadata.create_all(connection)
-    
+
+    # The schema is created once by the engine fixture; rolling back the
+    # outer transaction below keeps each test isolated
     yield session
     
     # Clean up
@@ -68,8 +65,13 @@ def db_session(engine):
     connection.close()
 
 @pytest.fixture
-def client(app):
-    """Create a test client."""
+def client(app, db_session):
+    """Create a test client bound to this test's database session."""
+    # Store db session in app context; the app is shared, the session is per test
+    app.extensions['sqlalchemy'] = {
+        'session': db_session,
+        'engine': db_session.bind
+    }
     return app.test_client()
 
 @pytest.fixture
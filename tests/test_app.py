@@ -5,7 +5,7 @@ from datetime import datetime
 from app.backend.db.models import User, InterviewSession, Response, Feedback, QuestionType
 from app.backend import create_app
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def app():
     """Create and configure a new app instance for testing."""
     app = create_app()
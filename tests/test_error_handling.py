@@ -1,7 +1,7 @@
 import pytest
 from app.backend import create_app
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def app():
     app = create_app({
         'TESTING': True,
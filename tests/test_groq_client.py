@@ -0,0 +1,216 @@
+import asyncio
+
+import groq_client
+from groq_client import question_cache_key
+
+HISTORY = (["Tell me about yourself."], ["I don't know."])
+
+def test_question_cache_key_ignores_unique_id():
+    # The route sends a fresh unique_id on every request, so it can't be part of the key
+    key_a = question_cache_key("Engineer", *HISTORY, session_id="a")
+    key_b = question_cache_key("Engineer", *HISTORY, session_id="a")
+    assert key_a is not None
+    assert key_a == key_b
+
+def test_question_cache_key_skips_new_sessions():
+    assert question_cache_key("Engineer", [], [], is_new_session=True, session_id="a") is None
+
+def test_question_cache_key_skips_requests_without_session():
+    assert question_cache_key("Engineer", *HISTORY) is None
+
+def test_question_cache_key_separates_sessions():
+    key_a = question_cache_key("Engineer", *HISTORY, session_id="a")
+    key_b = question_cache_key("Engineer", *HISTORY, session_id="b")
+    assert key_a is not None
+    assert key_a != key_b
+
+def test_question_cache_key_covers_full_history():
+    # Same question count and last answer, different earlier questions
+    key_a = question_cache_key("Engineer", ["Q1", "Q2"], ["A1", "I don't know."], session_id="a")
+    key_b = question_cache_key("Engineer", ["Q3", "Q2"], ["A1", "I don't know."], session_id="a")
+    assert key_a != key_b
+
+def test_route_style_requests_share_a_cache_key(monkeypatch):
+    calls = []
+
+    def fake_send(prompt, model, **kwargs):
+        calls.append(kwargs['cache_key'])
+        return "What drew you to this role?"
+
+    groq_client.clear_response_cache()
+    monkeypatch.setattr(groq_client, '_USE_MOCK', False)
+    monkeypatch.setattr(groq_client, 'send_message', fake_send)
+    for unique_id in ("1-2-3-4", "5-6-7-8"):
+        groq_client.generate_interview_question(
+            "Engineer", *HISTORY, unique_id=unique_id, session_id="a"
+        )
+    # Both requests get the same key, so the second one would hit the cache
+    assert calls[0] is not None
+    assert calls[0] == calls[1]
+
+class _Delta:
+    def __init__(self, content):
+        self.content = content
+
+class _Choice:
+    def __init__(self, content):
+        self.delta = _Delta(content)
+
+class _Chunk:
+    def __init__(self, content):
+        self.choices = [_Choice(content)]
+
+class _FakeStream:
+    def __init__(self, pieces):
+        self._chunks = [_Chunk(p) for p in pieces]
+        self.closed = False
+
+    def __iter__(self):
+        return iter(self._chunks)
+
+    def close(self):
+        self.closed = True
+
+class _FakeCompletions:
+    def __init__(self, stream):
+        self.stream = stream
+        self.kwargs = None
+
+    def create(self, **kwargs):
+        self.kwargs = kwargs
+        return self.stream
+
+class _FakeClient:
+    def __init__(self, stream):
+        self.chat = type('Chat', (), {})()
+        self.chat.completions = _FakeCompletions(stream)
+
+def test_streamed_question_survives_lead_in_and_blank_line(monkeypatch):
+    stream = _FakeStream([
+        "Here's the opening question:", "\n\n", "What drew you ", "to this role?", "\n\nThis question helps"
+    ])
+    client = _FakeClient(stream)
+    monkeypatch.setattr(groq_client, '_USE_MOCK', False)
+    monkeypatch.setattr(groq_client, 'get_client', lambda: client)
+
+    response = groq_client.send_message("prompt", stop_on_question=True)
+
+    assert "stop" not in client.chat.completions.kwargs
+    assert stream.closed
+    assert response.endswith("What drew you to this role?")
+    assert groq_client.clean_question_response(response) == "What drew you to this role?"
+
+class _FakeAsyncStream(_FakeStream):
+    def __aiter__(self):
+        return self._aiter()
+
+    async def _aiter(self):
+        for chunk in self._chunks:
+            yield chunk
+
+    async def close(self):
+        self.closed = True
+
+class _FakeAsyncCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        return _FakeAsyncStream(["What drew you ", "to this role?"])
+
+class _FakeAsyncClient:
+    def __init__(self):
+        self.chat = type('Chat', (), {})()
+        self.chat.completions = _FakeAsyncCompletions()
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+def test_question_batches_close_their_client(monkeypatch):
+    clients = []
+
+    def new_client():
+        clients.append(_FakeAsyncClient())
+        return clients[-1]
+
+    monkeypatch.setattr(groq_client, '_USE_MOCK', False)
+    monkeypatch.setattr(groq_client, '_new_async_client', new_client)
+    specs = [{"job_role": "Engineer", "unique_id": str(i)} for i in range(3)]
+
+    # Each batch runs on a fresh event loop, so each gets (and closes) its own client
+    for _ in range(2):
+        questions = groq_client.generate_interview_questions_batch(specs)
+        assert questions == ["What drew you to this role?"] * 3
+
+    assert len(clients) == 2
+    assert all(c.closed and c.chat.completions.calls == 3 for c in clients)
+
+def _stream_question(monkeypatch, pieces):
+    stream = _FakeStream(pieces)
+    monkeypatch.setattr(groq_client, '_USE_MOCK', False)
+    monkeypatch.setattr(groq_client, 'get_client', lambda: _FakeClient(stream))
+    response = groq_client.send_message("prompt", stop_on_question=True)
+    assert stream.closed
+    return groq_client.clean_question_response(response)
+
+def test_streamed_question_keeps_two_part_question(monkeypatch):
+    question = _stream_question(monkeypatch, [
+        "Tell me about a conflict in your team? ", "How did you handle it?", " I'm asking because"
+    ])
+    assert question == "Tell me about a conflict in your team? How did you handle it?"
+
+def test_streamed_question_keeps_follow_up_instruction(monkeypatch):
+    question = _stream_question(monkeypatch, [
+        "What is dependency injection? Explain how ", "you'd use it in a web app.", "\n\nThis tests"
+    ])
+    assert question == "What is dependency injection? Explain how you'd use it in a web app."
+
+def test_async_message_closes_its_own_client(monkeypatch):
+    clients = []
+
+    def new_client():
+        clients.append(_FakeAsyncClient())
+        return clients[-1]
+
+    monkeypatch.setattr(groq_client, '_USE_MOCK', False)
+    monkeypatch.setattr(groq_client, '_new_async_client', new_client)
+    for _ in range(2):
+        response = asyncio.run(groq_client.send_message_async("prompt", stop_on_question=True))
+        assert response == "What drew you to this role?"
+
+    assert len(clients) == 2
+    assert all(c.closed for c in clients)
+
+def test_meta_phrases_are_tried_in_list_order():
+    # "i'd like to ask" comes first in the text, but "to begin with" is earlier in _META_PHRASES
+    cleaned = groq_client.clean_question_response(
+        "I'd like to ask you to begin with what drew you to software engineering as a career?"
+    )
+    assert cleaned == "What drew you to software engineering as a career?"
+
+def test_meta_phrase_keeps_text_up_to_its_next_occurrence():
+    cleaned = groq_client.clean_question_response(
+        "To get started tell me about your current role and responsibilities? "
+        "To get started is always the hardest part."
+    )
+    assert cleaned == "Tell me about your current role and responsibilities?"
+
+def test_lead_in_with_colon_is_stripped():
+    cleaned = groq_client.clean_question_response(
+        "Here's a natural opening question: What drew you to this role?"
+    )
+    assert cleaned == "What drew you to this role?"
+
+def test_lead_in_sentence_without_colon_is_stripped():
+    cleaned = groq_client.clean_question_response(
+        "Here's a question that comes up a lot. How do you prioritize competing deadlines?"
+    )
+    assert cleaned == "How do you prioritize competing deadlines?"
+
+def test_lead_in_without_colon_is_stripped_up_to_that():
+    cleaned = groq_client.clean_question_response(
+        "Here's a question that I'd love your take on how you would design a rate limiter?"
+    )
+    assert cleaned == "I'd love your take on how you would design a rate limiter?"
@@ -2,12 +2,65 @@ import os
 import sys
 import pytest
 from app.backend import create_app
-from app.backend.nlp import get_nlp, analyze_response
-from app.backend.nlp.advanced_analysis import AdvancedNLPAnalysis
+from app.backend.nlp import get_nlp, analyze_response, analyze_responses
 
 # Add the project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+LONG_RESPONSE = "This is a very long response. " * 1000
+
+# (response, question) for every test that checks a single analysis; they are
+# all analyzed in one batch by the `analyses` fixture
+CASES = {
+    # Sample interview response using STAR format
+    'star': ("""
+    When I was working at my previous company, we faced a critical deadline for a client project.
+    I needed to coordinate with multiple teams to ensure timely delivery.
+    I implemented a new project management system and conducted daily stand-ups to track progress.
+    As a result, we delivered the project two days ahead of schedule and received excellent client feedback.
+    """, "Tell me about a time you handled a challenging project."),
+    # Response missing some STAR components
+    'incomplete': ("""
+    I faced a challenging situation at work.
+    It was stressful, but I handled it well.
+    """, "Tell me about a time you handled a challenging situation."),
+    # Professional response
+    'professional': ("""
+    In my previous role, I led a cross-functional team to develop a new product.
+    We followed agile methodologies and maintained clear communication throughout the project.
+    The product was successfully launched ahead of schedule.
+    """, "Tell me about a leadership experience."),
+    # Clear and concise response
+    'clear': ("""
+    I implemented a new feature that improved user engagement by 20%.
+    The feature was well-received by users and received positive feedback.
+    """, "Tell me about a successful project."),
+    # Positive sentiment response
+    'positive': ("""
+    I'm excited about the opportunities at your company.
+    I believe my skills align perfectly with the role.
+    I'm eager to contribute to your team.
+    """, "Why are you interested in this position?"),
+    # Long response
+    'long': (LONG_RESPONSE, "Tell me about your experience."),
+    # Response with special characters
+    'special_characters': ("""I've worked with various technologies: Python, Java, & C++.""",
+                           "Tell me about your technical experience."),
+    # Response in multiple languages
+    'multiple_languages': ("""I can communicate in English and Spanish.
+    I've worked with international teams and understand cultural differences.""",
+                           "Tell me about your language skills."),
+    # Response with technical jargon
+    'technical_jargon': ("""I implemented a RESTful API using Flask and SQLAlchemy.
+    The system uses JWT for authentication and Redis for caching.""",
+                         "Tell me about your technical experience."),
+    # Single word response
+    'single_word': ("Success", "Describe your success."),
+    # Response matching question context
+    'matching_context': ("I developed a machine learning model for natural language processing.",
+                         "Machine learning experience?"),
+}
+
 @pytest.fixture(scope='module')
 def app():
     app = create_app()
@@ -22,19 +75,14 @@ def app():
 def nlp_models(app):
     get_nlp()
 
-def test_response_analysis(nlp_models):
-    # Sample interview response using STAR format
-    response = """
-    When I was working at my previous company, we faced a critical deadline for a client project.
-    I needed to coordinate with multiple teams to ensure timely delivery.
-    I implemented a new project management system and conducted daily stand-ups to track progress.
-    As a result, we delivered the project two days ahead of schedule and received excellent client feedback.
-    """
-
-    question = "Tell me about a time you handled a challenging project."
+@pytest.fixture(scope='module')
+def analyses(nlp_models):
+    """Analyze every case in CASES with one batched call."""
+    results = analyze_responses(list(CASES.values()))
+    return dict(zip(CASES, results))
 
-    # Analyze the response
-    analysis = analyze_response(response, question)
+def test_response_analysis(analyses):
+    analysis = analyses['star']
 
     # Check if all expected components are present
     assert 'feedback' in analysis
@@ -45,47 +93,17 @@ def test_response_analysis(nlp_models):
     assert 'clarity' in analysis['scores']
     assert 'completeness' in analysis['scores']
 
-def test_incomplete_response(nlp_models):
-    # Response missing some STAR components
-    response = """
-    I faced a challenging situation at work.
-    It was stressful, but I handled it well.
-    """
-
-    analysis = analyze_response(response, "Tell me about a time you handled a challenging situation.")
-    assert analysis['scores']['completeness'] < 0.8
-
-def test_professional_tone(nlp_models):
-    # Professional response
-    professional_response = """
-    In my previous role, I led a cross-functional team to develop a new product.
-    We followed agile methodologies and maintained clear communication throughout the project.
-    The product was successfully launched ahead of schedule.
-    """
-
-    analysis = analyze_response(professional_response, "Tell me about a leadership experience.")
-    assert analysis['scores']['professional_tone'] > 0.4
+def test_incomplete_response(analyses):
+    assert analyses['incomplete']['scores']['completeness'] < 0.8
 
-def test_clarity_metrics(nlp_models):
-    # Clear and concise response
-    clear_response = """
-    I implemented a new feature that improved user engagement by 20%.
-    The feature was well-received by users and received positive feedback.
-    """
+def test_professional_tone(analyses):
+    assert analyses['professional']['scores']['professional_tone'] > 0.4
 
-    analysis = analyze_response(clear_response, "Tell me about a successful project.")
-    assert analysis['scores']['clarity'] > 0.4
+def test_clarity_metrics(analyses):
+    assert analyses['clear']['scores']['clarity'] > 0.4
 
-def test_sentiment_analysis(nlp_models):
-    # Positive sentiment response
-    positive_response = """
-    I'm excited about the opportunities at your company.
-    I believe my skills align perfectly with the role.
-    I'm eager to contribute to your team.
-    """
-
-    analysis = analyze_response(positive_response, "Why are you interested in this position?")
-    assert analysis['scores']['sentiment'] == 1.0
+def test_sentiment_analysis(analyses):
+    assert analyses['positive']['scores']['sentiment'] == 1.0
 
 def test_empty_response(nlp_models):
     # Test empty response handling
@@ -97,32 +115,18 @@ def test_empty_response(nlp_models):
     assert analysis['feedback'] == 'Response text cannot be empty'
     assert 'Please provide a response' in analysis['suggestions']
 
-def test_long_response(nlp_models):
-    # Test long response handling
-    long_response = """ """.join(["This is a very long response. " * 1000])
-    analysis = analyze_response(long_response, "Tell me about your experience.")
-    assert analysis['scores']['clarity'] < 0.6
-    assert len(long_response) > 512  # Verify it was a long response
-
-def test_special_characters(nlp_models):
-    # Test response with special characters
-    special_response = """I've worked with various technologies: Python, Java, & C++."""
-    analysis = analyze_response(special_response, "Tell me about your technical experience.")
-    assert analysis['scores']['clarity'] > 0.4
-
-def test_multiple_languages(nlp_models):
-    # Test response in multiple languages
-    multi_lang_response = """I can communicate in English and Spanish.
-    I've worked with international teams and understand cultural differences."""
-    analysis = analyze_response(multi_lang_response, "Tell me about your language skills.")
-    assert analysis['scores']['clarity'] > 0.5
-
-def test_technical_jargon(nlp_models):
-    # Test response with technical jargon
-    technical_response = """I implemented a RESTful API using Flask and SQLAlchemy.
-    The system uses JWT for authentication and Redis for caching."""
-    analysis = analyze_response(technical_response, "Tell me about your technical experience.")
-    assert analysis['scores']['clarity'] > 0.5
+def test_long_response(analyses):
+    assert analyses['long']['scores']['clarity'] < 0.6
+    assert len(LONG_RESPONSE) > 512  # Verify it was a long response
+
+def test_special_characters(analyses):
+    assert analyses['special_characters']['scores']['clarity'] > 0.4
+
+def test_multiple_languages(analyses):
+    assert analyses['multiple_languages']['scores']['clarity'] > 0.5
+
+def test_technical_jargon(analyses):
+    assert analyses['technical_jargon']['scores']['clarity'] > 0.5
 
 def test_performance(nlp_models):
     """Test performance with multiple iterations."""
@@ -134,16 +138,10 @@ def test_performance(nlp_models):
         analysis = analyze_response(response, question)
         assert analysis['scores']['completeness'] >= 0
 
-def test_edge_cases(nlp_models):
+def test_edge_cases(analyses):
     """Test various edge cases."""
-    # Single word response
-    single_word = "Success"
-    single_word_analysis = analyze_response(single_word, "Describe your success.")
-    assert single_word_analysis['scores']['completeness'] < 0.5
+    assert analyses['single_word']['scores']['completeness'] < 0.5
 
-def test_contextual_analysis(nlp_models):
+def test_contextual_analysis(analyses):
     """Test context-aware analysis."""
-    # Response matching question context
-    matching_response = "I developed a machine learning model for natural language processing."
-    matching_analysis = analyze_response(matching_response, "Machine learning experience?")
-    assert matching_analysis['scores']['completeness'] > 0.05
\ No newline at end of file
+    assert analyses['matching_context']['scores']['completeness'] > 0.05
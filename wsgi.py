@@ -0,0 +1,10 @@
+"""
+WSGI entry point for production servers.
+
+Run with, for example:
+    gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5000 --capture-output wsgi:app
+"""
+
+from flask_app import get_app
+
+app = get_app()